@@ -35,6 +35,10 @@ MAX_CONVERSATION_CACHE_SIZE = 100
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_CONNECT_TIMEOUT = 10.0  # Connection establishment timeout
 
+# Default connection pool limits (whatever the installed httpx defaults to).
+# Callers that poll for long stretches can pass limits= with a longer keepalive_expiry
+DEFAULT_LIMITS = httpx.Limits()
+
 # Auth error detection patterns (case-insensitive)
 AUTH_ERROR_PATTERNS = (
     "authentication",
@@ -95,6 +99,7 @@ class ClientCore:
         connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
         refresh_callback: Callable[[], Awaitable[AuthTokens]] | None = None,
         refresh_retry_delay: float = 0.2,
+        limits: httpx.Limits | None = None,
     ):
         """Initialize the core client.
 
@@ -107,10 +112,13 @@ class ClientCore:
             refresh_callback: Optional async callback to refresh auth tokens on failure.
                 If provided, rpc_call will automatically retry once after refreshing.
             refresh_retry_delay: Delay in seconds before retrying after refresh.
+            limits: Connection pool limits for the HTTP client. Defaults to
+                DEFAULT_LIMITS, i.e. httpx's own default pool limits.
         """
         self.auth = auth
         self._timeout = timeout
         self._connect_timeout = connect_timeout
+        self._limits = limits if limits is not None else DEFAULT_LIMITS
         self._refresh_callback = refresh_callback
         self._refresh_retry_delay = refresh_retry_delay
         self._refresh_lock: asyncio.Lock | None = asyncio.Lock() if refresh_callback else None
@@ -141,6 +149,7 @@ class ClientCore:
                     "Cookie": self.auth.cookie_header,
                 },
                 timeout=timeout,
+                limits=self._limits,
             )
 
     async def close(self) -> None:
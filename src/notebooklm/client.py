@@ -23,6 +23,8 @@ import logging
 import re
 from pathlib import Path
 
+import httpx
+
 from ._artifacts import ArtifactsAPI
 from ._chat import ChatAPI
 from ._core import DEFAULT_TIMEOUT, ClientCore
@@ -73,16 +75,25 @@ class NotebookLMClient:
         auth: The AuthTokens used for authentication
     """
 
-    def __init__(self, auth: AuthTokens, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        auth: AuthTokens,
+        timeout: float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits | None = None,
+    ):
         """Initialize the NotebookLM client.
 
         Args:
             auth: Authentication tokens from browser login.
             timeout: HTTP request timeout in seconds. Defaults to 30 seconds.
+            limits: Optional httpx connection pool limits. Defaults to httpx's
+                own limits.
         """
         # Pass refresh_auth as callback for automatic retry on auth failures
         # Note: refresh_auth calls update_auth_headers internally
-        self._core = ClientCore(auth, timeout=timeout, refresh_callback=self.refresh_auth)
+        self._core = ClientCore(
+            auth, timeout=timeout, refresh_callback=self.refresh_auth, limits=limits
+        )
 
         # Initialize sub-client APIs
         # Note: notes must be initialized before artifacts (artifacts uses notes API)
@@ -118,7 +129,10 @@ class NotebookLMClient:
 
     @classmethod
     async def from_storage(
-        cls, path: str | None = None, timeout: float = DEFAULT_TIMEOUT
+        cls,
+        path: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits | None = None,
     ) -> "NotebookLMClient":
         """Create a client from Playwright storage state file.
 
@@ -129,6 +143,7 @@ class NotebookLMClient:
             path: Path to storage_state.json. If None, uses default location
                   (~/.notebooklm/storage_state.json).
             timeout: HTTP request timeout in seconds. Defaults to 30 seconds.
+            limits: Optional httpx connection pool limits.
 
         Returns:
             NotebookLMClient instance (not yet connected).
@@ -139,7 +154,7 @@ class NotebookLMClient:
         """
         storage_path = Path(path) if path else None
         auth = await AuthTokens.from_storage(storage_path)
-        return cls(auth, timeout=timeout)
+        return cls(auth, timeout=timeout, limits=limits)
 
     async def refresh_auth(self) -> AuthTokens:
         """Refresh authentication tokens by fetching the NotebookLM homepage.
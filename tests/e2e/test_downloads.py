@@ -15,104 +15,63 @@ PDF_MAGIC = b"%PDF"
 MP4_FTYP = b"ftyp"  # At offset 4
 
 
-def is_png(path: str) -> bool:
-    """Check if file is a valid PNG by magic bytes."""
-    with open(path, "rb") as f:
-        return f.read(8) == PNG_MAGIC
+# (offset, magic bytes) -> format label
+_MAGICS = {
+    (0, PNG_MAGIC): "png",
+    (0, PDF_MAGIC): "pdf",
+    (4, MP4_FTYP): "mp4",
+}
 
 
-def is_pdf(path: str) -> bool:
-    """Check if file is a valid PDF by magic bytes."""
-    with open(path, "rb") as f:
-        return f.read(4) == PDF_MAGIC
-
-
-def is_mp4(path: str) -> bool:
-    """Check if file is a valid MP4 by magic bytes."""
+def detect_format(path: str) -> str | None:
+    """Identify a downloaded file as png, pdf or mp4 from its header bytes."""
     with open(path, "rb") as f:
         header = f.read(12)
-        # MP4 has 'ftyp' at offset 4
-        return len(header) >= 8 and header[4:8] == MP4_FTYP
+    return next(
+        (
+            label
+            for (offset, magic), label in _MAGICS.items()
+            if header[offset : offset + len(magic)] == magic
+        ),
+        None,
+    )
 
 
 @requires_auth
-class TestDownloadAudio:
+class TestDownloadMedia:
     @pytest.mark.asyncio
     @pytest.mark.readonly
-    async def test_download_audio(self, client, read_only_notebook_id):
-        """Downloads existing audio artifact - read-only.
+    @pytest.mark.parametrize(
+        ("method_name", "filename", "expected_format"),
+        [
+            ("download_audio", "audio.mp4", "mp4"),
+            ("download_video", "video.mp4", "mp4"),
+            ("download_infographic", "infographic.png", "png"),
+            ("download_slide_deck", "slides.pdf", "pdf"),
+        ],
+        ids=["audio", "video", "infographic", "slide_deck"],
+    )
+    async def test_download_media(
+        self, client, read_only_notebook_id, method_name, filename, expected_format
+    ):
+        """Downloads existing audio, video, infographic and slide deck - read-only.
 
         Note: NotebookLM serves audio in MP4 container format (MPEG-DASH),
         not MP3. The file extension .mp4 is correct.
         """
+        download = getattr(client.artifacts, method_name)
         with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "audio.mp4")
-            try:
-                result = await client.artifacts.download_audio(read_only_notebook_id, output_path)
-                assert result == output_path
-                assert os.path.exists(output_path)
-                assert os.path.getsize(output_path) > 0
-                assert is_mp4(output_path), "Downloaded audio is not a valid MP4 file"
-            except ArtifactNotReadyError:
-                pytest.skip("No completed audio artifact available")
-
-
-@requires_auth
-class TestDownloadVideo:
-    @pytest.mark.asyncio
-    @pytest.mark.readonly
-    async def test_download_video(self, client, read_only_notebook_id):
-        """Downloads existing video artifact - read-only."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "video.mp4")
-            try:
-                result = await client.artifacts.download_video(read_only_notebook_id, output_path)
-                assert result == output_path
-                assert os.path.exists(output_path)
-                assert os.path.getsize(output_path) > 0
-                assert is_mp4(output_path), "Downloaded video is not a valid MP4 file"
-            except ArtifactNotReadyError:
-                pytest.skip("No completed video artifact available")
-
-
-@requires_auth
-class TestDownloadInfographic:
-    @pytest.mark.asyncio
-    @pytest.mark.readonly
-    async def test_download_infographic(self, client, read_only_notebook_id):
-        """Downloads existing infographic - read-only."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "infographic.png")
+            output_path = os.path.join(tmpdir, filename)
             try:
-                result = await client.artifacts.download_infographic(
-                    read_only_notebook_id, output_path
-                )
+                result = await download(read_only_notebook_id, output_path)
                 assert result == output_path
-                assert os.path.exists(output_path)
-                assert os.path.getsize(output_path) > 0
-                assert is_png(output_path), "Downloaded infographic is not a valid PNG file"
-            except ArtifactNotReadyError:
-                pytest.skip("No completed infographic artifact available")
-
-
-@requires_auth
-class TestDownloadSlideDeck:
-    @pytest.mark.asyncio
-    @pytest.mark.readonly
-    async def test_download_slide_deck(self, client, read_only_notebook_id):
-        """Downloads existing slide deck as PDF - read-only."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "slides.pdf")
-            try:
-                result = await client.artifacts.download_slide_deck(
-                    read_only_notebook_id, output_path
+                assert os.stat(output_path).st_size > 0
+                assert detect_format(output_path) == expected_format, (
+                    f"Downloaded file is not a valid {expected_format.upper()} file"
                 )
-                assert result == output_path
-                assert os.path.exists(output_path)
-                assert os.path.getsize(output_path) > 0
-                assert is_pdf(output_path), "Downloaded slide deck is not a valid PDF file"
             except ArtifactNotReadyError:
-                pytest.skip("No completed slide deck artifact available")
+                kind = method_name.removeprefix("download_").replace("_", " ")
+                pytest.skip(f"No completed {kind} artifact available")
 
 
 @requires_auth
@@ -174,8 +133,7 @@ class TestDownloadReport:
             try:
                 result = await client.artifacts.download_report(read_only_notebook_id, output_path)
                 assert result == output_path
-                assert os.path.exists(output_path)
-                assert os.path.getsize(output_path) > 0
+                assert os.stat(output_path).st_size > 0
                 assert is_valid_markdown(output_path), "Downloaded report is not valid markdown"
             except ArtifactNotReadyError:
                 pytest.skip("No completed report artifact available")
@@ -194,8 +152,7 @@ class TestDownloadMindMap:
                     read_only_notebook_id, output_path
                 )
                 assert result == output_path
-                assert os.path.exists(output_path)
-                assert os.path.getsize(output_path) > 0
+                assert os.stat(output_path).st_size > 0
                 assert is_valid_json(output_path), "Downloaded mind map is not valid JSON"
 
                 # Verify structure
@@ -219,8 +176,7 @@ class TestDownloadDataTable:
                     read_only_notebook_id, output_path
                 )
                 assert result == output_path
-                assert os.path.exists(output_path)
-                assert os.path.getsize(output_path) > 0
+                assert os.stat(output_path).st_size > 0
                 assert is_valid_csv(output_path), "Downloaded data table is not valid CSV"
             except ArtifactNotReadyError:
                 pytest.skip("No completed data table artifact available")
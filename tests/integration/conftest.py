@@ -2,12 +2,26 @@
 
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
+from notebooklm import NotebookLMClient
 from notebooklm.auth import AuthTokens
 from notebooklm.rpc import RPCMethod
+from vcr_config import CachingPersister, notebooklm_vcr
+
+# =============================================================================
+# Request matching constants shared by the pytest-httpx tests
+# =============================================================================
+
+# source-path query parameter sent with every notebook-scoped RPC to nb_123
+NB123_SOURCE_PATH = "/notebook/nb_123"
+# batchexecute URL of the rename RPC (pytest-httpx applies re.match())
+RENAME_URL_RE = re.compile(rf".*rpcids={RPCMethod.RENAME_NOTEBOOK.value}")
 
 # =============================================================================
 # VCR Cassette Availability Check
@@ -15,16 +29,12 @@ from notebooklm.rpc import RPCMethod
 
 CASSETTES_DIR = Path(__file__).parent.parent / "cassettes"
 
-# Check if cassettes are available (more than just example files)
-_real_cassettes = (
-    [f for f in CASSETTES_DIR.glob("*.yaml") if not f.name.startswith("example_")]
-    if CASSETTES_DIR.exists()
-    else []
-)
-
-# Skip VCR tests if no real cassettes exist (unless in record mode)
+# Skip VCR tests if no real cassettes exist (unless in record mode).
+# Checked once at import; any() stops at the first real (non-example) cassette.
 _vcr_record_mode = os.environ.get("NOTEBOOKLM_VCR_RECORD", "").lower() in ("1", "true", "yes")
-_cassettes_available = bool(_real_cassettes) or _vcr_record_mode
+_cassettes_available = _vcr_record_mode or any(
+    not f.name.startswith("example_") for f in CASSETTES_DIR.glob("*.yaml")
+)
 
 # Marker for skipping VCR tests when cassettes are not available
 skip_no_cassettes = pytest.mark.skipif(
@@ -33,32 +43,79 @@ skip_no_cassettes = pytest.mark.skipif(
 )
 
 
+_prefetch_executor: ThreadPoolExecutor | None = None
+
+
+def pytest_collection_finish(session):
+    """Start parsing every cassette in the background once collection is done.
+
+    Only in replay mode, and only if a collected test uses VCR, so the first
+    cassette-backed tests find their interactions already in CachingPersister's
+    cache. xdist workers skip this: each one runs only a few test files.
+    """
+    global _prefetch_executor
+    library_dir = notebooklm_vcr.cassette_library_dir
+    if (
+        _vcr_record_mode
+        or not _cassettes_available
+        or hasattr(session.config, "workerinput")
+        or not os.path.isdir(library_dir)
+        or not any(item.get_closest_marker("vcr") for item in session.items)
+    ):
+        return
+    serializer = notebooklm_vcr.serializers[notebooklm_vcr.serializer]
+    _prefetch_executor = ThreadPoolExecutor(max_workers=8)
+    with os.scandir(library_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".yaml"):
+                # Same path string vcrpy builds, so the cache keys match
+                path = os.path.join(library_dir, entry.name)
+                _prefetch_executor.submit(CachingPersister.load_cassette, path, serializer)
+
+
+def pytest_sessionfinish(session):
+    if _prefetch_executor is not None:
+        _prefetch_executor.shutdown(cancel_futures=True)
+
+
+_vcr_auth: AuthTokens | None = None
+
+
 async def get_vcr_auth() -> AuthTokens:
     """Get auth tokens for VCR tests.
 
     In record mode: loads real auth from storage (required for recording).
     In replay mode: returns mock auth (cassettes have recorded responses).
+
+    The tokens are loaded on the first call and reused for the rest of the
+    session, so recording only reads storage and fetches tokens once.
     """
-    if _vcr_record_mode:
-        return await AuthTokens.from_storage()
-    else:
-        # Mock auth for replay - values don't matter, VCR replays recorded responses
-        return AuthTokens(
-            cookies={
-                "SID": "mock_sid",
-                "HSID": "mock_hsid",
-                "SSID": "mock_ssid",
-                "APISID": "mock_apisid",
-                "SAPISID": "mock_sapisid",
-            },
-            csrf_token="mock_csrf_token",
-            session_id="mock_session_id",
-        )
+    global _vcr_auth
+    if _vcr_auth is None:
+        if _vcr_record_mode:
+            _vcr_auth = await AuthTokens.from_storage()
+        else:
+            # Mock auth for replay - values don't matter, VCR replays recorded responses
+            _vcr_auth = AuthTokens(
+                cookies={
+                    "SID": "mock_sid",
+                    "HSID": "mock_hsid",
+                    "SSID": "mock_ssid",
+                    "APISID": "mock_apisid",
+                    "SAPISID": "mock_sapisid",
+                },
+                csrf_token="mock_csrf_token",
+                session_id="mock_session_id",
+            )
+    return _vcr_auth
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_tokens():
-    """Create test authentication tokens."""
+    """Create test authentication tokens.
+
+    Session-scoped: tests only read these tokens, so one instance is shared.
+    """
     return AuthTokens(
         cookies={
             "SID": "test_sid",
@@ -72,29 +129,122 @@ def auth_tokens():
     )
 
 
+@pytest.fixture(scope="module")
+def sync_client(auth_tokens):
+    """Unopened client shared by tests that never issue HTTP requests.
+
+    Only the in-memory parts of the API (e.g. the conversation cache) are
+    usable; tests that make RPC calls should open their own client.
+    """
+    return NotebookLMClient(auth_tokens)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _session_client(auth_tokens):
+    """Open client shared by the whole test session; use ``client`` instead."""
+    async with NotebookLMClient(auth_tokens) as c:
+        yield c
+
+
 @pytest.fixture
+def client(_session_client):
+    """Open client shared across tests, with its conversation cache cleared.
+
+    pytest-httpx patches httpx's transport class per test, so requests from
+    this long-lived client are still served by each test's httpx_mock. The
+    conversation cache is the only client state that outlives a test, so it
+    is reset here. Tests using it must run on the session event loop, e.g.
+    with ``@pytest.mark.asyncio(loop_scope="session")``.
+    """
+    _session_client.chat.clear_cache()
+    return _session_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _session_vcr_client():
+    """Open VCR client shared by the whole test session; use ``vcr_client`` instead."""
+    async with NotebookLMClient(await get_vcr_auth()) as c:
+        yield c
+
+
+@pytest.fixture
+def vcr_client(_session_vcr_client):
+    """Open client for VCR tests, with its conversation cache cleared.
+
+    vcrpy patches httpx's transport classes while a cassette is in use, so
+    this long-lived client replays (or records) through each test's cassette.
+    Tests using it must run on the session event loop.
+    """
+    _session_vcr_client.chat.clear_cache()
+    return _session_vcr_client
+
+
+@pytest.fixture(scope="session")
+def vcr_test_file(tmp_path_factory):
+    """Text file uploaded by the VCR add_file test, written once per session."""
+    path = tmp_path_factory.mktemp("vcr_uploads") / "vcr_test_document.txt"
+    path.write_text("This is a test document for VCR cassette recording.")
+    return path
+
+
+@pytest.fixture(scope="session")
 def build_rpc_response():
     """Factory for building RPC responses.
 
+    The factory is stateless, so a single instance serves the whole session.
+
     Args:
         rpc_id: Either an RPCMethod enum or string RPC ID.
         data: The response data to encode.
+
+    Returns:
+        The framed response body as bytes, ready for httpx_mock.
     """
 
-    def _build(rpc_id: RPCMethod | str, data) -> str:
+    def _build(rpc_id: RPCMethod | str, data) -> bytes:
         # Convert RPCMethod to string value if needed
         rpc_id_str = rpc_id.value if isinstance(rpc_id, RPCMethod) else rpc_id
         inner = json.dumps(data)
         chunk = json.dumps(["wrb.fr", rpc_id_str, inner, None, None])
-        return f")]}}'\n{len(chunk)}\n{chunk}\n"
+        return f")]}}'\n{len(chunk)}\n{chunk}\n".encode()
 
     return _build
 
 
-@pytest.fixture
-def mock_list_notebooks_response():
-    """Mock response for listing notebooks."""
-    inner_data = json.dumps(
+@pytest.fixture(scope="session")
+def build_streamed_response():
+    """Factory for building streamed chat (GenerateFreeFormStreamed) responses.
+
+    Args:
+        inner_data: The answer payload to encode.
+
+    Returns:
+        The framed response body as bytes.
+    """
+    # Anti-XSSI prefix that starts every streamed response
+    prefix = b")]}'\n"
+    # json.dumps() builds a new encoder per call when given separators
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _build(inner_data) -> bytes:
+        inner = encode(inner_data)
+        chunk = encode([["wrb.fr", None, inner]]).encode()
+        return b"".join((prefix, str(len(chunk)).encode(), b"\n", chunk, b"\n"))
+
+    return _build
+
+
+@pytest.fixture(scope="session")
+def rename_notebook_ok_bytes(build_rpc_response):
+    """Encoded empty RENAME_NOTEBOOK reply (also used for chat settings updates)."""
+    return build_rpc_response(RPCMethod.RENAME_NOTEBOOK, None)
+
+
+@pytest.fixture(scope="session")
+def mock_list_notebooks_response(build_rpc_response):
+    """Encoded mock response for listing notebooks, built once per session."""
+    return build_rpc_response(
+        RPCMethod.LIST_NOTEBOOKS,
         [
             [
                 [
@@ -114,8 +264,5 @@ def mock_list_notebooks_response():
                     [None, None, None, None, None, [1704153600, 0]],
                 ],
             ]
-        ]
+        ],
     )
-    rpc_id = RPCMethod.LIST_NOTEBOOKS.value
-    chunk = json.dumps([["wrb.fr", rpc_id, inner_data, None, None]])
-    return f")]}}'\n{len(chunk)}\n{chunk}\n"
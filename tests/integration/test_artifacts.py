@@ -34,12 +34,12 @@ class TestStudioContent:
                 ]
             ],
         )
-        httpx_mock.add_response(content=notebook_response.encode())
+        httpx_mock.add_response(content=notebook_response)
 
         audio_response = build_rpc_response(
             RPCMethod.CREATE_ARTIFACT, [["artifact_123", "Audio Overview", "2024-01-05", None, 1]]
         )
-        httpx_mock.add_response(content=audio_response.encode())
+        httpx_mock.add_response(content=audio_response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_audio(notebook_id="nb_123")
@@ -71,12 +71,12 @@ class TestStudioContent:
                 ]
             ],
         )
-        httpx_mock.add_response(content=notebook_response.encode())
+        httpx_mock.add_response(content=notebook_response)
 
         response = build_rpc_response(
             RPCMethod.CREATE_ARTIFACT, [["artifact_123", "Audio Overview", "2024-01-05", None, 1]]
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_audio(
@@ -111,8 +111,8 @@ class TestStudioContent:
         video_response = build_rpc_response(
             RPCMethod.CREATE_ARTIFACT, [["artifact_456", "Video Overview", "2024-01-05", None, 1]]
         )
-        httpx_mock.add_response(content=notebook_response.encode())
-        httpx_mock.add_response(content=video_response.encode())
+        httpx_mock.add_response(content=notebook_response)
+        httpx_mock.add_response(content=video_response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_video(
@@ -147,8 +147,8 @@ class TestStudioContent:
         slide_deck_response = build_rpc_response(
             RPCMethod.CREATE_ARTIFACT, [["artifact_456", "Slide Deck", "2024-01-05", None, 1]]
         )
-        httpx_mock.add_response(content=notebook_response.encode())
-        httpx_mock.add_response(content=slide_deck_response.encode())
+        httpx_mock.add_response(content=notebook_response)
+        httpx_mock.add_response(content=slide_deck_response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_slide_deck(notebook_id="nb_123")
@@ -173,7 +173,7 @@ class TestStudioContent:
             3,  # COMPLETED status
         ]
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [[artifact]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.poll_status(
@@ -209,8 +209,8 @@ class TestGenerateQuiz:
         quiz_response = build_rpc_response(
             RPCMethod.CREATE_ARTIFACT, [["quiz_123", "Quiz", "2024-01-05", None, 1]]
         )
-        httpx_mock.add_response(content=notebook_response.encode())
-        httpx_mock.add_response(content=quiz_response.encode())
+        httpx_mock.add_response(content=notebook_response)
+        httpx_mock.add_response(content=quiz_response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_quiz("nb_123")
@@ -228,7 +228,7 @@ class TestDeleteStudioContent:
         build_rpc_response,
     ):
         response = build_rpc_response(RPCMethod.DELETE_ARTIFACT, [True])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.delete("nb_123", "task_id_123")
@@ -258,8 +258,8 @@ class TestMindMap:
             ],
         )
         mindmap_response = build_rpc_response(RPCMethod.GENERATE_MIND_MAP, None)
-        httpx_mock.add_response(content=notebook_response.encode())
-        httpx_mock.add_response(content=mindmap_response.encode())
+        httpx_mock.add_response(content=notebook_response)
+        httpx_mock.add_response(content=mindmap_response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_mind_map("nb_123")
@@ -290,8 +290,8 @@ class TestArtifactsAPI:
         )
         # Response for GET_NOTES_AND_MIND_MAPS (cFji9) - empty (no mind maps)
         response2 = build_rpc_response(RPCMethod.GET_NOTES_AND_MIND_MAPS, [[]])
-        httpx_mock.add_response(content=response1.encode())
-        httpx_mock.add_response(content=response2.encode())
+        httpx_mock.add_response(content=response1)
+        httpx_mock.add_response(content=response2)
 
         async with NotebookLMClient(auth_tokens) as client:
             artifacts = await client.artifacts.list("nb_123")
@@ -307,7 +307,7 @@ class TestArtifactsAPI:
     ):
         """Test renaming an artifact."""
         response = build_rpc_response(RPCMethod.RENAME_ARTIFACT, None)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             await client.artifacts.rename("nb_123", "art_001", "New Title")
@@ -324,7 +324,7 @@ class TestArtifactsAPI:
     ):
         """Test exporting an artifact."""
         response = build_rpc_response(RPCMethod.EXPORT_ARTIFACT, ["export_content_here"])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.export("nb_123", "art_001")
@@ -357,8 +357,8 @@ class TestArtifactsAPI:
         flashcards_response = build_rpc_response(
             RPCMethod.CREATE_ARTIFACT, [["fc_123", "Flashcards", "2024-01-05", None, 1]]
         )
-        httpx_mock.add_response(content=notebook_response.encode())
-        httpx_mock.add_response(content=flashcards_response.encode())
+        httpx_mock.add_response(content=notebook_response)
+        httpx_mock.add_response(content=flashcards_response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_flashcards("nb_123")
@@ -390,8 +390,8 @@ class TestArtifactsAPI:
         guide_response = build_rpc_response(
             RPCMethod.CREATE_ARTIFACT, [["sg_123", "Study Guide", "2024-01-05", None, 1]]
         )
-        httpx_mock.add_response(content=notebook_response.encode())
-        httpx_mock.add_response(content=guide_response.encode())
+        httpx_mock.add_response(content=notebook_response)
+        httpx_mock.add_response(content=guide_response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_study_guide("nb_123")
@@ -423,8 +423,8 @@ class TestArtifactsAPI:
         infographic_response = build_rpc_response(
             RPCMethod.CREATE_ARTIFACT, [["ig_123", "Infographic", "2024-01-05", None, 1]]
         )
-        httpx_mock.add_response(content=notebook_response.encode())
-        httpx_mock.add_response(content=infographic_response.encode())
+        httpx_mock.add_response(content=notebook_response)
+        httpx_mock.add_response(content=infographic_response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_infographic("nb_123")
@@ -456,8 +456,8 @@ class TestArtifactsAPI:
         table_response = build_rpc_response(
             RPCMethod.CREATE_ARTIFACT, [["dt_123", "Data Table", "2024-01-05", None, 1]]
         )
-        httpx_mock.add_response(content=notebook_response.encode())
-        httpx_mock.add_response(content=table_response.encode())
+        httpx_mock.add_response(content=notebook_response)
+        httpx_mock.add_response(content=table_response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.generate_data_table("nb_123")
@@ -477,8 +477,8 @@ class TestArtifactsAPI:
         response1 = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [])
         # Response for GET_NOTES_AND_MIND_MAPS (cFji9) - empty
         response2 = build_rpc_response(RPCMethod.GET_NOTES_AND_MIND_MAPS, [[]])
-        httpx_mock.add_response(content=response1.encode())
-        httpx_mock.add_response(content=response2.encode())
+        httpx_mock.add_response(content=response1)
+        httpx_mock.add_response(content=response2)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.get("nb_123", "nonexistent")
@@ -500,7 +500,7 @@ class TestArtifactsAPI:
                 ["art_002", "Quiz", 4, None, 3],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             artifacts = await client.artifacts.list_audio("nb_123")
@@ -522,7 +522,7 @@ class TestArtifactsAPI:
                 ["art_002", "Audio Overview", 1, None, 3],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             artifacts = await client.artifacts.list_video("nb_123")
@@ -552,7 +552,7 @@ class TestArtifactsAPI:
                 ],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             artifacts = await client.artifacts.list_quizzes("nb_123")
@@ -568,7 +568,7 @@ class TestArtifactsAPI:
     ):
         """Test deleting an artifact."""
         response = build_rpc_response(RPCMethod.DELETE_ARTIFACT, None)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.delete("nb_123", "art_001")
@@ -600,7 +600,7 @@ class TestArtifactsAPI:
                 ],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             artifacts = await client.artifacts.list_flashcards("nb_123")
@@ -622,7 +622,7 @@ class TestArtifactsAPI:
                 ["art_002", "Audio", 1, None, 3],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             artifacts = await client.artifacts.list_infographics("nb_123")
@@ -644,7 +644,7 @@ class TestArtifactsAPI:
                 ["art_002", "Video", 3, None, 3],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             artifacts = await client.artifacts.list_slide_decks("nb_123")
@@ -665,7 +665,7 @@ class TestArtifactErrorPaths:
         """Test download_audio raises error when no completed audio exists."""
         # LIST_ARTIFACTS returns empty (no audio artifacts)
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [[]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             with pytest.raises(ArtifactNotReadyError):
@@ -688,7 +688,7 @@ class TestArtifactErrorPaths:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             with pytest.raises(ArtifactNotReadyError):
@@ -705,7 +705,7 @@ class TestArtifactErrorPaths:
     ):
         """Test download_video raises error when no completed video exists."""
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [[]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             with pytest.raises(ArtifactNotReadyError):
@@ -720,7 +720,7 @@ class TestArtifactErrorPaths:
     ):
         """Test download_infographic raises error when none completed."""
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [[]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             with pytest.raises(ArtifactNotReadyError):
@@ -735,7 +735,7 @@ class TestArtifactErrorPaths:
     ):
         """Test download_slide_deck raises error when none completed."""
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [[]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             with pytest.raises(ArtifactNotReadyError):
@@ -758,7 +758,7 @@ class TestArtifactErrorPaths:
             1,  # PROCESSING status
         ]
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [[artifact]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.poll_status(
@@ -786,7 +786,7 @@ class TestArtifactErrorPaths:
             4,  # FAILED status
         ]
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [[artifact]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.artifacts.poll_status(
@@ -822,8 +822,8 @@ class TestArtifactErrorPaths:
         response1 = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [[]])
         # Response for GET_NOTES_AND_MIND_MAPS (cFji9) - empty
         response2 = build_rpc_response(RPCMethod.GET_NOTES_AND_MIND_MAPS, [[]])
-        httpx_mock.add_response(content=response1.encode())
-        httpx_mock.add_response(content=response2.encode())
+        httpx_mock.add_response(content=response1)
+        httpx_mock.add_response(content=response2)
 
         async with NotebookLMClient(auth_tokens) as client:
             artifacts = await client.artifacts.list("nb_123")
@@ -862,7 +862,7 @@ class TestDownloadReport:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         output_path = tmp_path / "report.md"
         async with NotebookLMClient(auth_tokens) as client:
@@ -882,7 +882,7 @@ class TestDownloadReport:
     ):
         """Test error when no report exists."""
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             with pytest.raises(ArtifactNotReadyError):
@@ -916,7 +916,7 @@ class TestDownloadMindMap:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         output_path = tmp_path / "mindmap.json"
         async with NotebookLMClient(auth_tokens) as client:
@@ -936,7 +936,7 @@ class TestDownloadMindMap:
     ):
         """Test error when no mind map exists."""
         response = build_rpc_response(RPCMethod.GET_NOTES_AND_MIND_MAPS, [[]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             with pytest.raises(ArtifactNotReadyError):
@@ -982,7 +982,7 @@ class TestDownloadDataTable:
 
         # Data needs to be [[artifact1]] because _list_raw does result[0]
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [[artifact]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         output_path = tmp_path / "data.csv"
         async with NotebookLMClient(auth_tokens) as client:
@@ -1004,7 +1004,7 @@ class TestDownloadDataTable:
     ):
         """Test error when no data table exists."""
         response = build_rpc_response(RPCMethod.LIST_ARTIFACTS, [])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             with pytest.raises(ArtifactNotReadyError):
@@ -1,7 +1,7 @@
 """Integration tests for automatic token refresh."""
 
 import asyncio
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import httpx
 import pytest
@@ -11,16 +11,42 @@ from notebooklm.auth import AuthTokens
 from notebooklm.rpc import RPCError
 
 
+class _StubResponse:
+    """Minimal stand-in for httpx.Response with a no-op raise_for_status()."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def _base_auth():
+    """Auth tokens shared by every test in this module."""
+    return AuthTokens(
+        cookies={"SID": "test"},
+        csrf_token="csrf",
+        session_id="sid",
+    )
+
+
+@pytest.fixture
+def auth(_base_auth):
+    """Shared auth tokens with csrf_token restored after each test.
+
+    Refresh tests rewrite csrf_token in place, so snapshot and restore it
+    instead of building a new AuthTokens per test.
+    """
+    original_csrf = _base_auth.csrf_token
+    yield _base_auth
+    _base_auth.csrf_token = original_csrf
+
+
 class TestAutoRefreshIntegration:
     @pytest.mark.asyncio
-    async def test_client_has_refresh_callback_wired(self):
+    async def test_client_has_refresh_callback_wired(self, auth):
         """NotebookLMClient should wire refresh_auth as callback."""
-        auth = AuthTokens(
-            cookies={"SID": "test"},
-            csrf_token="csrf",
-            session_id="sid",
-        )
-
         client = NotebookLMClient(auth)
         # Bound methods aren't identical, so compare underlying function
         assert client._core._refresh_callback is not None
@@ -28,14 +54,8 @@ class TestAutoRefreshIntegration:
         assert client._core._refresh_lock is not None
 
     @pytest.mark.asyncio
-    async def test_full_refresh_flow_http_error(self):
+    async def test_full_refresh_flow_http_error(self, auth, monkeypatch):
         """Test complete auto-refresh flow for HTTP 401 errors."""
-        auth = AuthTokens(
-            cookies={"SID": "test"},
-            csrf_token="old_csrf",
-            session_id="sid",
-        )
-
         client = NotebookLMClient(auth)
         # Override retry delay for faster tests
         client._core._refresh_retry_delay = 0
@@ -63,30 +83,22 @@ class TestAutoRefreshIntegration:
                 response = httpx.Response(401, request=request)
                 raise httpx.HTTPStatusError("Unauthorized", request=request, response=response)
             # Second call: success
-            response = MagicMock()
-            response.text = ')]}\'\\n[["wrb.fr","wXbhsf",[[[["nb1"],["Notebook 1"]]]]]]'
-            response.raise_for_status = MagicMock()
-            return response
+            return _StubResponse(')]}\'\\n[["wrb.fr","wXbhsf",[[[["nb1"],["Notebook 1"]]]]]]')
 
         async with client:
             client._core._http_client.post = mock_post
-
-            with patch("notebooklm._core.decode_response") as mock_decode:
-                mock_decode.return_value = [[["nb1"], ["Notebook 1"]]]
-                await client.notebooks.list()
+            monkeypatch.setattr(
+                "notebooklm._core.decode_response",
+                lambda *args, **kwargs: [[["nb1"], ["Notebook 1"]]],
+            )
+            await client.notebooks.list()
 
         assert len(refresh_calls) == 1, "Should have refreshed once"
         assert call_count[0] == 2, "Should have retried once"
 
     @pytest.mark.asyncio
-    async def test_full_refresh_flow_rpc_error(self):
+    async def test_full_refresh_flow_rpc_error(self, auth, monkeypatch):
         """Test complete auto-refresh flow for RPC auth errors."""
-        auth = AuthTokens(
-            cookies={"SID": "test"},
-            csrf_token="old_csrf",
-            session_id="sid",
-        )
-
         client = NotebookLMClient(auth)
         client._core._refresh_retry_delay = 0
 
@@ -102,10 +114,7 @@ class TestAutoRefreshIntegration:
 
         # Mock HTTP to succeed, but decode_response to fail with auth error first
         async def mock_post(*args, **kwargs):
-            response = MagicMock()
-            response.text = "mock response"
-            response.raise_for_status = MagicMock()
-            return response
+            return _StubResponse("mock response")
 
         decode_count = [0]
 
@@ -117,22 +126,15 @@ class TestAutoRefreshIntegration:
 
         async with client:
             client._core._http_client.post = mock_post
-
-            with patch("notebooklm._core.decode_response", side_effect=mock_decode):
-                await client.notebooks.list()
+            monkeypatch.setattr("notebooklm._core.decode_response", mock_decode)
+            await client.notebooks.list()
 
         assert len(refresh_calls) == 1, "Should have refreshed once"
         assert decode_count[0] == 2, "Should have retried once"
 
     @pytest.mark.asyncio
-    async def test_refresh_delay_is_applied(self):
+    async def test_refresh_delay_is_applied(self, auth, monkeypatch):
         """Test that retry delay is actually applied."""
-        auth = AuthTokens(
-            cookies={"SID": "test"},
-            csrf_token="csrf",
-            session_id="sid",
-        )
-
         client = NotebookLMClient(auth)
         client._core._refresh_retry_delay = 0.1  # 100ms delay
 
@@ -149,33 +151,31 @@ class TestAutoRefreshIntegration:
                 request = httpx.Request("POST", args[0])
                 response = httpx.Response(401, request=request)
                 raise httpx.HTTPStatusError("Unauthorized", request=request, response=response)
-            response = MagicMock()
-            response.text = "mock"
-            response.raise_for_status = MagicMock()
-            return response
+            return _StubResponse("mock")
 
-        async with client:
-            client._core._http_client.post = mock_post
+        # Record the delays ClientCore requests instead of waiting on the wall
+        # clock. Only the asyncio seen by notebooklm._core is swapped, so other
+        # coroutines on the loop keep the real sleep.
+        sleeps: list[float] = []
+        real_sleep = asyncio.sleep
 
-            start_time = asyncio.get_event_loop().time()
+        async def fake_sleep(delay, *args, **kwargs):
+            sleeps.append(delay)
+            await real_sleep(0)
 
-            with patch("notebooklm._core.decode_response", return_value=[]):
-                await client.notebooks.list()
+        fake_asyncio = SimpleNamespace(**{**vars(asyncio), "sleep": fake_sleep})
 
-            elapsed = asyncio.get_event_loop().time() - start_time
+        async with client:
+            client._core._http_client.post = mock_post
+            monkeypatch.setattr("notebooklm._core.decode_response", lambda *args, **kwargs: [])
+            monkeypatch.setattr("notebooklm._core.asyncio", fake_asyncio)
+            await client.notebooks.list()
 
-        # Should have taken at least the delay time
-        assert elapsed >= 0.09, f"Delay should be applied, elapsed: {elapsed}"
+        assert sleeps == [0.1], f"ClientCore should sleep once for the delay, got: {sleeps}"
 
     @pytest.mark.asyncio
-    async def test_no_retry_on_cookie_expiration(self):
+    async def test_no_retry_on_cookie_expiration(self, auth):
         """Test that full cookie expiration is not retried (requires re-login)."""
-        auth = AuthTokens(
-            cookies={"SID": "test"},
-            csrf_token="csrf",
-            session_id="sid",
-        )
-
         client = NotebookLMClient(auth)
         client._core._refresh_retry_delay = 0
 
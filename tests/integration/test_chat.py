@@ -1,20 +1,145 @@
 """Integration tests for ChatAPI."""
 
+import json
+import re
+from dataclasses import dataclass
+from urllib.parse import parse_qs
+
 import pytest
 from pytest_httpx import HTTPXMock
 
-from notebooklm import NotebookLMClient
+from conftest import RENAME_URL_RE
+from notebooklm.exceptions import ValidationError
 from notebooklm.rpc import ChatGoal, ChatResponseLength, RPCMethod
 from notebooklm.types import ChatMode
 
+# Matches the streamed chat endpoint used by ChatAPI.ask(). pytest-httpx
+# applies re.match(), so the pattern needs a leading wildcard but no trailing one
+STREAM_URL_RE = re.compile(r".*GenerateFreeFormStreamed")
+# batchexecute URL of the history RPC; a request to any other RPC is unmatched
+HISTORY_URL_RE = re.compile(rf".*rpcids={RPCMethod.GET_CONVERSATION_HISTORY.value}")
+
+
+@dataclass(frozen=True, slots=True)
+class Cite:
+    """One citation entry of a streamed chat answer.
+
+    Structure discovered via API analysis:
+    cite[1][4] = [[passage_wrapper]] where passage_wrapper[0] = [start, end, nested]
+    nested = [[inner]] where inner = [start2, end2, text]
+    """
+
+    chunk_id: str
+    source_id: str
+    start_char: int
+    end_char: int
+    passage_start: int
+    passage_end: int
+    text: str
+    score: float = 0.9
+
+    def to_wire(self) -> list:
+        """Return the nested list form used in the streamed response."""
+        passage = [
+            self.start_char,
+            self.end_char,
+            [[[self.passage_start, self.passage_end, self.text]]],
+        ]
+        return [
+            [self.chunk_id],
+            [
+                None,
+                None,
+                self.score,
+                [[None]],
+                [[passage]],
+                [[[[self.source_id]]]],
+                [self.chunk_id],
+            ],
+        ]
+
+
+def _answer(text: str, chunk_refs: list, citations: list[Cite]) -> list:
+    """Build the inner data of a streamed chat answer."""
+    wire = [cite.to_wire() for cite in citations]
+    return [[text, None, chunk_refs, None, [[], None, None, wire, 1]]]
+
+
+CITATIONS_DATA = _answer(
+    "Machine learning is a subset of AI [1]. It uses algorithms to learn from data [2].",
+    ["chunk-001", "chunk-002", 987654],
+    [
+        Cite(
+            "chunk-001",
+            "11111111-1111-1111-1111-111111111111",
+            100,
+            250,
+            50,
+            120,
+            "Machine learning is a branch of artificial intelligence.",
+            score=0.95,
+        ),
+        Cite(
+            "chunk-002",
+            "22222222-2222-2222-2222-222222222222",
+            300,
+            450,
+            280,
+            380,
+            "Algorithms learn patterns from training data.",
+            score=0.88,
+        ),
+    ],
+)
+
+NO_CITATIONS_DATA = _answer(
+    "This is a simple answer without any source citations.",
+    [12345],
+    [],
+)
+
+CHAR_POSITIONS_DATA = _answer(
+    "Answer with citation [1].",
+    ["chunk-001", 12345],
+    [
+        Cite(
+            "chunk-001",
+            "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee",
+            1000,
+            1500,
+            950,
+            1100,
+            "Cited passage text.",
+        ),
+    ],
+)
+
+STREAM_CASES = {
+    "two_cites": CITATIONS_DATA,
+    "no_cites": NO_CITATIONS_DATA,
+    "char_positions": CHAR_POSITIONS_DATA,
+}
+
+
+@pytest.fixture(scope="module")
+def stream_bodies(build_streamed_response):
+    """Encoded streamed responses for every entry in STREAM_CASES."""
+    return {name: build_streamed_response(data) for name, data in STREAM_CASES.items()}
+
+
+@pytest.fixture
+def rename_notebook_response(httpx_mock: HTTPXMock, rename_notebook_ok_bytes):
+    """Register the empty RENAME_NOTEBOOK reply returned for chat settings updates."""
+    httpx_mock.add_response(url=RENAME_URL_RE, content=rename_notebook_ok_bytes, is_reusable=True)
+
 
 class TestChatAPI:
     """Integration tests for the ChatAPI."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_history(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -26,371 +151,158 @@ class TestChatAPI:
                 ["conv_002", "Explain AI", "Artificial intelligence...", 1704153600],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(url=HISTORY_URL_RE, content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.chat.get_history("nb_123")
+        result = await client.chat.get_history("nb_123")
 
         assert result is not None
-        request = httpx_mock.get_request()
-        assert RPCMethod.GET_CONVERSATION_HISTORY in str(request.url)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_history_empty(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         """Test getting empty conversation history."""
         response = build_rpc_response(RPCMethod.GET_CONVERSATION_HISTORY, [])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(url=HISTORY_URL_RE, content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.chat.get_history("nb_123")
+        result = await client.chat.get_history("nb_123")
 
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_configure_default_mode(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test configuring chat with default settings."""
-        response = build_rpc_response(RPCMethod.RENAME_NOTEBOOK, None)
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.chat.configure("nb_123")
-
-        request = httpx_mock.get_request()
-        assert RPCMethod.RENAME_NOTEBOOK in str(request.url)
-
-    @pytest.mark.asyncio
-    async def test_configure_learning_guide_mode(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.usefixtures("rename_notebook_response")
+    @pytest.mark.parametrize(
+        ("method", "args", "kwargs", "expected_settings"),
+        [
+            ("configure", (), {}, [[1], [1]]),
+            (
+                "configure",
+                (),
+                {"goal": ChatGoal.LEARNING_GUIDE, "response_length": ChatResponseLength.LONGER},
+                [[3], [4]],
+            ),
+            (
+                "configure",
+                (),
+                {"goal": ChatGoal.CUSTOM, "custom_prompt": "You are a helpful tutor."},
+                [[2, "You are a helpful tutor."], [1]],
+            ),
+            ("set_mode", (ChatMode.CONCISE,), {}, [[1], [5]]),
+        ],
+        ids=["default", "learning_guide", "custom_prompt", "set_mode"],
+    )
+    async def test_update_chat_settings(
+        self, client, httpx_mock: HTTPXMock, method, args, kwargs, expected_settings
     ):
-        """Test configuring chat as learning guide."""
-        response = build_rpc_response(RPCMethod.RENAME_NOTEBOOK, None)
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.chat.configure(
-                "nb_123",
-                goal=ChatGoal.LEARNING_GUIDE,
-                response_length=ChatResponseLength.LONGER,
-            )
+        """Test configure() and set_mode() send a RENAME_NOTEBOOK settings update."""
+        await getattr(client.chat, method)("nb_123", *args, **kwargs)
 
         request = httpx_mock.get_request()
-        assert RPCMethod.RENAME_NOTEBOOK in str(request.url)
+        assert request.url.params["rpcids"] == RPCMethod.RENAME_NOTEBOOK.value
+        f_req = json.loads(parse_qs(request.content.decode())["f.req"][0])
+        params = json.loads(f_req[0][0][1])
+        assert params == ["nb_123", [[None] * 7 + [expected_settings]]]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_configure_custom_mode_without_prompt_raises(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
     ):
         """Test that CUSTOM mode without prompt raises ValidationError."""
-        from notebooklm.exceptions import ValidationError
+        with pytest.raises(ValidationError, match="custom_prompt is required"):
+            await client.chat.configure("nb_123", goal=ChatGoal.CUSTOM)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            with pytest.raises(ValidationError, match="custom_prompt is required"):
-                await client.chat.configure("nb_123", goal=ChatGoal.CUSTOM)
-
-    @pytest.mark.asyncio
-    async def test_configure_custom_mode_with_prompt(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test configuring chat with custom prompt."""
-        response = build_rpc_response(RPCMethod.RENAME_NOTEBOOK, None)
-        httpx_mock.add_response(content=response.encode())
 
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.chat.configure(
-                "nb_123",
-                goal=ChatGoal.CUSTOM,
-                custom_prompt="You are a helpful tutor.",
-            )
+def _check_two_cites(result) -> None:
+    # Verify answer
+    assert "Machine learning" in result.answer
+    assert "[1]" in result.answer
+    assert "[2]" in result.answer
 
-        request = httpx_mock.get_request()
-        assert RPCMethod.RENAME_NOTEBOOK in str(request.url)
+    # Verify references
+    assert len(result.references) == 2
 
-    @pytest.mark.asyncio
-    async def test_set_mode(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test setting chat mode with predefined config."""
-        response = build_rpc_response(RPCMethod.RENAME_NOTEBOOK, None)
-        httpx_mock.add_response(content=response.encode())
+    # First reference
+    ref1 = result.references[0]
+    assert ref1.source_id == "11111111-1111-1111-1111-111111111111"
+    assert ref1.citation_number == 1
+    assert "artificial intelligence" in ref1.cited_text
 
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.chat.set_mode("nb_123", ChatMode.CONCISE)
+    # Second reference
+    ref2 = result.references[1]
+    assert ref2.source_id == "22222222-2222-2222-2222-222222222222"
+    assert ref2.citation_number == 2
+    assert "training data" in ref2.cited_text
 
-        request = httpx_mock.get_request()
-        assert RPCMethod.RENAME_NOTEBOOK in str(request.url)
 
-    def test_get_cached_turns_empty(self, auth_tokens):
-        """Test getting cached turns for new conversation."""
-        client = NotebookLMClient(auth_tokens)
-        turns = client.chat.get_cached_turns("nonexistent_conv")
-        assert turns == []
+def _check_no_cites(result) -> None:
+    assert result.answer == "This is a simple answer without any source citations."
+    assert len(result.references) == 0
 
-    def test_clear_cache(self, auth_tokens):
-        """Test clearing conversation cache."""
-        client = NotebookLMClient(auth_tokens)
-        result = client.chat.clear_cache("some_conv")
-        assert result is False
 
-    def test_clear_all_cache(self, auth_tokens):
-        """Test clearing all conversation caches."""
-        client = NotebookLMClient(auth_tokens)
-        result = client.chat.clear_cache()
-        assert result is True
+def _check_char_positions(result) -> None:
+    assert len(result.references) == 1
+    ref = result.references[0]
+    assert ref.start_char == 1000
+    assert ref.end_char == 1500
+    assert ref.chunk_id == "chunk-001"
 
 
 class TestChatReferences:
     """Integration tests for chat references and citations."""
 
-    @pytest.mark.asyncio
-    async def test_ask_with_citations_returns_references(
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize(
+        ("case", "check"),
+        [
+            ("two_cites", _check_two_cites),
+            ("no_cites", _check_no_cites),
+            ("char_positions", _check_char_positions),
+        ],
+        ids=["two_cites", "no_cites", "char_positions"],
+    )
+    async def test_ask_references(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
+        stream_bodies,
+        case,
+        check,
     ):
-        """Test ask() returns references when citations are present."""
-        import json
-        import re
-
-        # Build a realistic response with citations
-        # Structure discovered via API analysis:
-        # cite[1][4] = [[passage_wrapper]] where passage_wrapper[0] = [start, end, nested]
-        # nested = [[inner]] where inner = [start2, end2, text]
-        inner_data = [
-            [
-                "Machine learning is a subset of AI [1]. It uses algorithms to learn from data [2].",
-                None,
-                ["chunk-001", "chunk-002", 987654],
-                None,
-                [
-                    [],
-                    None,
-                    None,
-                    [
-                        # First citation
-                        [
-                            ["chunk-001"],
-                            [
-                                None,
-                                None,
-                                0.95,
-                                [[None]],
-                                [  # cite[1][4] - text passages
-                                    [  # passage_wrapper
-                                        [  # passage_data
-                                            100,  # start_char
-                                            250,  # end_char
-                                            [  # nested passages
-                                                [  # nested_group
-                                                    [  # inner
-                                                        50,
-                                                        120,
-                                                        "Machine learning is a branch of artificial intelligence.",
-                                                    ]
-                                                ]
-                                            ],
-                                        ]
-                                    ]
-                                ],
-                                [[[["11111111-1111-1111-1111-111111111111"]]]],
-                                ["chunk-001"],
-                            ],
-                        ],
-                        # Second citation
-                        [
-                            ["chunk-002"],
-                            [
-                                None,
-                                None,
-                                0.88,
-                                [[None]],
-                                [
-                                    [
-                                        [
-                                            300,
-                                            450,
-                                            [
-                                                [
-                                                    [
-                                                        280,
-                                                        380,
-                                                        "Algorithms learn patterns from training data.",
-                                                    ]
-                                                ]
-                                            ],
-                                        ]
-                                    ]
-                                ],
-                                [[[["22222222-2222-2222-2222-222222222222"]]]],
-                                ["chunk-002"],
-                            ],
-                        ],
-                    ],
-                    1,
-                ],
-            ]
-        ]
-        inner_json = json.dumps(inner_data)
-        chunk_json = json.dumps([["wrb.fr", None, inner_json]])
-        response_body = f")]}}'\n{len(chunk_json)}\n{chunk_json}\n"
-
+        """Test ask() parses the answer and its citation references."""
         httpx_mock.add_response(
-            url=re.compile(r".*GenerateFreeFormStreamed.*"),
-            content=response_body.encode(),
+            url=STREAM_URL_RE,
+            content=stream_bodies[case],
             method="POST",
         )
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.chat.ask(
-                notebook_id="test_nb",
-                question="What is machine learning?",
-                source_ids=["src_001"],
-            )
-
-        # Verify answer
-        assert "Machine learning" in result.answer
-        assert "[1]" in result.answer
-        assert "[2]" in result.answer
-
-        # Verify references
-        assert len(result.references) == 2
-
-        # First reference
-        ref1 = result.references[0]
-        assert ref1.source_id == "11111111-1111-1111-1111-111111111111"
-        assert ref1.citation_number == 1
-        assert "artificial intelligence" in ref1.cited_text
-
-        # Second reference
-        ref2 = result.references[1]
-        assert ref2.source_id == "22222222-2222-2222-2222-222222222222"
-        assert ref2.citation_number == 2
-        assert "training data" in ref2.cited_text
-
-    @pytest.mark.asyncio
-    async def test_ask_without_citations(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-    ):
-        """Test ask() works when no citations are in the response."""
-        import json
-        import re
-
-        inner_data = [
-            [
-                "This is a simple answer without any source citations.",
-                None,
-                [12345],
-                None,
-                [[], None, None, [], 1],
-            ]
-        ]
-        inner_json = json.dumps(inner_data)
-        chunk_json = json.dumps([["wrb.fr", None, inner_json]])
-        response_body = f")]}}'\n{len(chunk_json)}\n{chunk_json}\n"
-
-        httpx_mock.add_response(
-            url=re.compile(r".*GenerateFreeFormStreamed.*"),
-            content=response_body.encode(),
-            method="POST",
+        result = await client.chat.ask(
+            notebook_id="test_nb",
+            question="What is machine learning?",
+            source_ids=["src_001"],
         )
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.chat.ask(
-                notebook_id="test_nb",
-                question="Simple question",
-                source_ids=["src_001"],
-            )
+        check(result)
 
-        assert result.answer == "This is a simple answer without any source citations."
-        assert len(result.references) == 0
 
-    @pytest.mark.asyncio
-    async def test_references_include_char_positions(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-    ):
-        """Test that references include character position information."""
-        import json
-        import re
+class TestChatCacheSync:
+    """Synchronous tests for the conversation cache helpers."""
 
-        inner_data = [
-            [
-                "Answer with citation [1].",
-                None,
-                ["chunk-001", 12345],
-                None,
-                [
-                    [],
-                    None,
-                    None,
-                    [
-                        [
-                            ["chunk-001"],
-                            [
-                                None,
-                                None,
-                                0.9,
-                                [[None]],
-                                [
-                                    [
-                                        [
-                                            1000,  # start_char
-                                            1500,  # end_char
-                                            [[[[950, 1100, "Cited passage text."]]]],
-                                        ]
-                                    ]
-                                ],
-                                [[[["aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"]]]],
-                                ["chunk-001"],
-                            ],
-                        ],
-                    ],
-                    1,
-                ],
-            ]
-        ]
-        inner_json = json.dumps(inner_data)
-        chunk_json = json.dumps([["wrb.fr", None, inner_json]])
-        response_body = f")]}}'\n{len(chunk_json)}\n{chunk_json}\n"
+    def test_get_cached_turns_empty(self, sync_client):
+        """Test getting cached turns for new conversation."""
+        turns = sync_client.chat.get_cached_turns("nonexistent_conv")
+        assert turns == []
 
-        httpx_mock.add_response(
-            url=re.compile(r".*GenerateFreeFormStreamed.*"),
-            content=response_body.encode(),
-            method="POST",
-        )
+    def test_clear_cache(self, sync_client):
+        """Test clearing conversation cache."""
+        result = sync_client.chat.clear_cache("some_conv")
+        assert result is False
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.chat.ask(
-                notebook_id="test_nb",
-                question="Question",
-                source_ids=["src_001"],
-            )
-
-        assert len(result.references) == 1
-        ref = result.references[0]
-        assert ref.start_char == 1000
-        assert ref.end_char == 1500
-        assert ref.chunk_id == "chunk-001"
+    def test_clear_all_cache(self, sync_client):
+        """Test clearing all conversation caches."""
+        result = sync_client.chat.clear_cache()
+        assert result is True
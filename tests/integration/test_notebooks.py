@@ -3,84 +3,57 @@
 import pytest
 from pytest_httpx import HTTPXMock
 
-from notebooklm import Notebook, NotebookLMClient
+from conftest import NB123_SOURCE_PATH, RENAME_URL_RE
+from notebooklm import Notebook
 from notebooklm.rpc import RPCMethod
 
 
 class TestListNotebooks:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_list_notebooks_returns_notebooks(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         mock_list_notebooks_response,
     ):
-        httpx_mock.add_response(content=mock_list_notebooks_response.encode())
+        httpx_mock.add_response(content=mock_list_notebooks_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            notebooks = await client.notebooks.list()
+        notebooks = await client.notebooks.list()
 
         assert len(notebooks) == 2
         assert all(isinstance(nb, Notebook) for nb in notebooks)
         assert notebooks[0].title == "My First Notebook"
         assert notebooks[0].id == "nb_001"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_list_notebooks_request_format(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         mock_list_notebooks_response,
     ):
-        httpx_mock.add_response(content=mock_list_notebooks_response.encode())
+        httpx_mock.add_response(content=mock_list_notebooks_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.notebooks.list()
+        await client.notebooks.list()
 
         request = httpx_mock.get_request()
         assert request.method == "POST"
-        assert RPCMethod.LIST_NOTEBOOKS.value in str(request.url)
+        assert request.url.params["rpcids"] == RPCMethod.LIST_NOTEBOOKS.value
         assert b"f.req=" in request.content
 
-    @pytest.mark.asyncio
-    async def test_request_includes_cookies(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        mock_list_notebooks_response,
-    ):
-        httpx_mock.add_response(content=mock_list_notebooks_response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.notebooks.list()
-
-        request = httpx_mock.get_request()
         cookie_header = request.headers.get("cookie", "")
         assert "SID=test_sid" in cookie_header
         assert "HSID=test_hsid" in cookie_header
 
-    @pytest.mark.asyncio
-    async def test_request_includes_csrf(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        mock_list_notebooks_response,
-    ):
-        httpx_mock.add_response(content=mock_list_notebooks_response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.notebooks.list()
-
-        request = httpx_mock.get_request()
         body = request.content.decode()
         assert "at=test_csrf_token" in body
 
 
 class TestCreateNotebook:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_create_notebook(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -95,19 +68,18 @@ class TestCreateNotebook:
                 [None, None, None, None, None, [1704067200, 0]],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            notebook = await client.notebooks.create("My Notebook")
+        notebook = await client.notebooks.create("My Notebook")
 
         assert isinstance(notebook, Notebook)
         assert notebook.id == "new_nb_id"
         assert notebook.title == "My Notebook"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_create_notebook_request_contains_title(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -115,20 +87,19 @@ class TestCreateNotebook:
             RPCMethod.CREATE_NOTEBOOK,
             ["Test Title", [], "id", "📓", None, [None, None, None, None, None, [1704067200, 0]]],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.notebooks.create("Test Title")
+        await client.notebooks.create("Test Title")
 
         request = httpx_mock.get_request()
-        assert RPCMethod.CREATE_NOTEBOOK.value in str(request.url)
+        assert request.url.params["rpcids"] == RPCMethod.CREATE_NOTEBOOK.value
 
 
 class TestGetNotebook:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_notebook(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -145,19 +116,18 @@ class TestGetNotebook:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            notebook = await client.notebooks.get("nb_123")
+        notebook = await client.notebooks.get("nb_123")
 
         assert isinstance(notebook, Notebook)
         assert notebook.id == "nb_123"
         assert notebook.title == "Test Notebook"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_notebook_uses_source_path(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -165,60 +135,71 @@ class TestGetNotebook:
             RPCMethod.GET_NOTEBOOK,
             [["Name", [], "nb_123", "📘", None, [None, None, None, None, None, [1704067200, 0]]]],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.notebooks.get("nb_123")
+        await client.notebooks.get("nb_123")
 
         request = httpx_mock.get_request()
-        assert "source-path=%2Fnotebook%2Fnb_123" in str(request.url)
+        assert request.url.params["source-path"] == NB123_SOURCE_PATH
 
 
 class TestDeleteNotebook:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_delete_notebook(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         response = build_rpc_response(RPCMethod.DELETE_NOTEBOOK, [True])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.notebooks.delete("nb_123")
+        result = await client.notebooks.delete("nb_123")
 
         assert result is True
 
 
 class TestSummary:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            (["Summary of the notebook content..."], "Summary of the notebook content..."),
+            (
+                ["This is a comprehensive summary of the notebook content..."],
+                "This is a comprehensive summary of the notebook content...",
+            ),
+            ([], ""),
+        ],
+        ids=["short", "comprehensive", "empty"],
+    )
     async def test_get_summary(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
+        payload,
+        expected,
     ):
-        response = build_rpc_response(RPCMethod.SUMMARIZE, ["Summary of the notebook content..."])
-        httpx_mock.add_response(content=response.encode())
+        response = build_rpc_response(RPCMethod.SUMMARIZE, payload)
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.notebooks.get_summary("nb_123")
+        result = await client.notebooks.get_summary("nb_123")
 
-        assert "Summary" in result
+        assert result == expected
 
 
 class TestRenameNotebook:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_rename_notebook(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         # First response for rename (returns null)
         rename_response = build_rpc_response(RPCMethod.RENAME_NOTEBOOK, None)
-        httpx_mock.add_response(content=rename_response.encode())
+        httpx_mock.add_response(content=rename_response)
         # Second response for get_notebook call after rename
         get_response = build_rpc_response(
             RPCMethod.GET_NOTEBOOK,
@@ -233,25 +214,24 @@ class TestRenameNotebook:
                 ]
             ],
         )
-        httpx_mock.add_response(content=get_response.encode())
+        httpx_mock.add_response(content=get_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            notebook = await client.notebooks.rename("nb_123", "New Title")
+        notebook = await client.notebooks.rename("nb_123", "New Title")
 
         assert isinstance(notebook, Notebook)
         assert notebook.id == "nb_123"
         assert notebook.title == "New Title"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_rename_notebook_request_format(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         # Rename response (returns null)
         rename_response = build_rpc_response(RPCMethod.RENAME_NOTEBOOK, None)
-        httpx_mock.add_response(content=rename_response.encode())
+        httpx_mock.add_response(content=rename_response)
         # Get notebook response after rename
         get_response = build_rpc_response(
             RPCMethod.GET_NOTEBOOK,
@@ -266,23 +246,21 @@ class TestRenameNotebook:
                 ]
             ],
         )
-        httpx_mock.add_response(content=get_response.encode())
+        httpx_mock.add_response(content=get_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.notebooks.rename("nb_123", "Renamed")
+        await client.notebooks.rename("nb_123", "Renamed")
 
-        request = httpx_mock.get_requests()[0]
-        assert RPCMethod.RENAME_NOTEBOOK.value in str(request.url)
-        assert "source-path=%2F" in str(request.url)
+        request = httpx_mock.get_request(url=RENAME_URL_RE)
+        assert request.url.params["source-path"] == "/"
 
 
 class TestNotebooksAPIAdditional:
     """Additional integration tests for NotebooksAPI."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_share_notebook(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -291,56 +269,35 @@ class TestNotebooksAPIAdditional:
             RPCMethod.SHARE_ARTIFACT,
             None,  # Share returns null, we build the URL
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.notebooks.share("nb_123", public=True)
+        result = await client.notebooks.share("nb_123", public=True)
 
         assert result["public"] is True
         assert "nb_123" in result["url"]
         request = httpx_mock.get_request()
-        assert RPCMethod.SHARE_ARTIFACT.value in str(request.url)
+        assert request.url.params["rpcids"] == RPCMethod.SHARE_ARTIFACT.value
 
-    @pytest.mark.asyncio
-    async def test_get_summary_additional(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test getting notebook summary."""
-        response = build_rpc_response(
-            RPCMethod.SUMMARIZE,
-            ["This is a comprehensive summary of the notebook content..."],
-        )
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.notebooks.get_summary("nb_123")
-
-        assert "summary" in result.lower()
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_remove_from_recent(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         """Test removing notebook from recent list."""
         response = build_rpc_response("fejl7e", None)  # REMOVE_RECENTLY_VIEWED
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.notebooks.remove_from_recent("nb_123")
+        await client.notebooks.remove_from_recent("nb_123")
 
         request = httpx_mock.get_request()
-        assert "fejl7e" in str(request.url)
+        assert request.url.params["rpcids"] == "fejl7e"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_raw(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -350,19 +307,18 @@ class TestNotebooksAPIAdditional:
             ["extra", "metadata"],
         ]
         response = build_rpc_response(RPCMethod.GET_NOTEBOOK, raw_data)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.notebooks.get_raw("nb_123")
+        result = await client.notebooks.get_raw("nb_123")
 
         assert result == raw_data
         request = httpx_mock.get_request()
-        assert "source-path=%2Fnotebook%2Fnb_123" in str(request.url)
+        assert request.url.params["source-path"] == NB123_SOURCE_PATH
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_description(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -379,10 +335,9 @@ class TestNotebooksAPIAdditional:
                 ],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            description = await client.notebooks.get_description("nb_123")
+        description = await client.notebooks.get_description("nb_123")
 
         assert description.summary == "This notebook covers AI research."
         assert len(description.suggested_topics) == 2
@@ -393,58 +348,27 @@ class TestNotebooksAPIAdditional:
 class TestNotebookEdgeCases:
     """Test edge cases for NotebooksAPI."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("payload", [[], [[]]], ids=["empty", "nested_empty"])
     async def test_list_notebooks_empty(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
+        payload,
     ):
-        """Test listing notebooks when none exist."""
-        response = build_rpc_response(RPCMethod.LIST_NOTEBOOKS, [])
-        httpx_mock.add_response(content=response.encode())
+        """Test listing notebooks when none exist, with flat or nested empty data."""
+        response = build_rpc_response(RPCMethod.LIST_NOTEBOOKS, payload)
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            notebooks = await client.notebooks.list()
+        notebooks = await client.notebooks.list()
 
         assert notebooks == []
 
-    @pytest.mark.asyncio
-    async def test_list_notebooks_nested_empty(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test listing notebooks with nested empty array."""
-        response = build_rpc_response(RPCMethod.LIST_NOTEBOOKS, [[]])
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            notebooks = await client.notebooks.list()
-
-        assert notebooks == []
-
-    @pytest.mark.asyncio
-    async def test_get_summary_empty(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test getting summary when empty."""
-        response = build_rpc_response(RPCMethod.SUMMARIZE, [])
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.notebooks.get_summary("nb_123")
-
-        assert result == ""
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_description_empty_topics(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -453,18 +377,17 @@ class TestNotebookEdgeCases:
             RPCMethod.SUMMARIZE,
             [["Summary text"], []],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            description = await client.notebooks.get_description("nb_123")
+        description = await client.notebooks.get_description("nb_123")
 
         assert description.summary == "Summary text"
         assert description.suggested_topics == []
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_description_malformed_topics(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -482,10 +405,9 @@ class TestNotebookEdgeCases:
                 ],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            description = await client.notebooks.get_description("nb_123")
+        description = await client.notebooks.get_description("nb_123")
 
         assert description.summary == "Summary"
         # Should only include valid topics
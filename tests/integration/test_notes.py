@@ -3,34 +3,48 @@
 import pytest
 from pytest_httpx import HTTPXMock
 
-from notebooklm import NotebookLMClient
+from conftest import NB123_SOURCE_PATH
 from notebooklm.rpc import RPCMethod
 
+# Two notes followed by two mind maps, shared by the list/get tests below
+NOTES_AND_MIND_MAPS = [
+    [
+        ["note_001", ["note_001", "Note content 1", None, None, "My First Note"]],
+        ["note_002", ["note_002", "Note content 2", None, None, "My Second Note"]],
+        ["mm_001", ["mm_001", '{"title":"Mind Map 1","children":[]}', None, None, "MM1"]],
+        ["mm_002", ["mm_002", '{"nodes":[{"id":"1"}]}', None, None, "MM2"]],
+    ]
+]
+
+
+@pytest.fixture(scope="module")
+def notes_and_mind_maps_bytes(build_rpc_response):
+    """Encoded GET_NOTES_AND_MIND_MAPS reply for NOTES_AND_MIND_MAPS."""
+    return build_rpc_response(RPCMethod.GET_NOTES_AND_MIND_MAPS, NOTES_AND_MIND_MAPS)
+
+
+@pytest.fixture
+def notes_and_mind_maps_response(httpx_mock: HTTPXMock, notes_and_mind_maps_bytes):
+    """Register the shared notes and mind maps reply for one request."""
+    httpx_mock.add_response(content=notes_and_mind_maps_bytes)
+
 
 class TestNotesAPI:
     """Integration tests for the NotesAPI."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_list_notes(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
-        """Test listing notes in a notebook."""
-        response = build_rpc_response(
-            RPCMethod.GET_NOTES_AND_MIND_MAPS,
-            [
-                [
-                    ["note_001", ["note_001", "Note content 1", None, None, "My First Note"]],
-                    ["note_002", ["note_002", "Note content 2", None, None, "My Second Note"]],
-                ]
-            ],
-        )
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            notes = await client.notes.list("nb_123")
+        """Test listing notes in a notebook that has no mind maps."""
+        notes_only = [NOTES_AND_MIND_MAPS[0][:2]]
+        response = build_rpc_response(RPCMethod.GET_NOTES_AND_MIND_MAPS, notes_only)
+        httpx_mock.add_response(content=response)
+
+        notes = await client.notes.list("nb_123")
 
         assert len(notes) == 2
         assert notes[0].id == "note_001"
@@ -39,203 +53,126 @@ class TestNotesAPI:
         assert notes[1].id == "note_002"
         assert notes[1].title == "My Second Note"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_list_notes_empty(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         """Test listing notes when notebook is empty."""
         response = build_rpc_response(RPCMethod.GET_NOTES_AND_MIND_MAPS, [[]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            notes = await client.notes.list("nb_123")
+        notes = await client.notes.list("nb_123")
 
         assert notes == []
 
-    @pytest.mark.asyncio
-    async def test_list_notes_excludes_mind_maps(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.usefixtures("notes_and_mind_maps_response")
+    async def test_list_notes_excludes_mind_maps(self, client):
         """Test that list() filters out mind maps."""
-        response = build_rpc_response(
-            RPCMethod.GET_NOTES_AND_MIND_MAPS,
-            [
-                [
-                    ["note_001", ["note_001", "Regular note content", None, None, "Regular Note"]],
-                    [
-                        "mm_001",
-                        ["mm_001", '{"title":"Mind Map","children":[]}', None, None, "Mind Map"],
-                    ],
-                ]
-            ],
-        )
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            notes = await client.notes.list("nb_123")
-
-        assert len(notes) == 1
-        assert notes[0].id == "note_001"
+        notes = await client.notes.list("nb_123")
 
-    @pytest.mark.asyncio
-    async def test_get_note(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
+        assert [note.id for note in notes] == ["note_001", "note_002"]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.usefixtures("notes_and_mind_maps_response")
+    async def test_get_note(self, client):
         """Test getting a specific note by ID."""
-        response = build_rpc_response(
-            RPCMethod.GET_NOTES_AND_MIND_MAPS,
-            [
-                [
-                    ["note_001", ["note_001", "Content 1", None, None, "Note 1"]],
-                    ["note_002", ["note_002", "Content 2", None, None, "Note 2"]],
-                ]
-            ],
-        )
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            note = await client.notes.get("nb_123", "note_002")
+        note = await client.notes.get("nb_123", "note_002")
 
         assert note is not None
         assert note.id == "note_002"
-        assert note.title == "Note 2"
-        assert note.content == "Content 2"
+        assert note.title == "My Second Note"
+        assert note.content == "Note content 2"
 
-    @pytest.mark.asyncio
-    async def test_get_note_not_found(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.usefixtures("notes_and_mind_maps_response")
+    async def test_get_note_not_found(self, client):
         """Test getting a note that doesn't exist."""
-        response = build_rpc_response(
-            RPCMethod.GET_NOTES_AND_MIND_MAPS,
-            [
-                [
-                    ["note_001", ["note_001", "Content", None, None, "Title"]],
-                ]
-            ],
-        )
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            note = await client.notes.get("nb_123", "nonexistent")
+        note = await client.notes.get("nb_123", "nonexistent")
 
         assert note is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_create_note(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         """Test creating a new note."""
         create_response = build_rpc_response(RPCMethod.CREATE_NOTE, [["new_note_id"]])
-        httpx_mock.add_response(content=create_response.encode())
+        httpx_mock.add_response(content=create_response)
 
         update_response = build_rpc_response(RPCMethod.UPDATE_NOTE, None)
-        httpx_mock.add_response(content=update_response.encode())
+        httpx_mock.add_response(content=update_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            note = await client.notes.create("nb_123", "My Title", "My Content")
+        note = await client.notes.create("nb_123", "My Title", "My Content")
 
         assert note.id == "new_note_id"
         assert note.title == "My Title"
         assert note.content == "My Content"
 
-        requests = httpx_mock.get_requests()
-        assert RPCMethod.CREATE_NOTE in str(requests[0].url)
-        assert RPCMethod.UPDATE_NOTE in str(requests[1].url)
+        rpc_ids = [request.url.params["rpcids"] for request in httpx_mock.get_requests()]
+        assert rpc_ids == [RPCMethod.CREATE_NOTE.value, RPCMethod.UPDATE_NOTE.value]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_update_note(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         """Test updating an existing note."""
         response = build_rpc_response(RPCMethod.UPDATE_NOTE, None)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.notes.update("nb_123", "note_001", "Updated content", "Updated title")
+        await client.notes.update("nb_123", "note_001", "Updated content", "Updated title")
 
-        request = httpx_mock.get_request()
-        assert RPCMethod.UPDATE_NOTE in str(request.url)
-        assert "source-path=%2Fnotebook%2Fnb_123" in str(request.url)
+        params = httpx_mock.get_request().url.params
+        assert params["rpcids"] == RPCMethod.UPDATE_NOTE.value
+        assert params["source-path"] == NB123_SOURCE_PATH
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_delete_note(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         """Test deleting a note."""
         response = build_rpc_response(RPCMethod.DELETE_NOTE, None)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.notes.delete("nb_123", "note_001")
+        result = await client.notes.delete("nb_123", "note_001")
 
         assert result is True
         request = httpx_mock.get_request()
-        assert RPCMethod.DELETE_NOTE in str(request.url)
+        assert request.url.params["rpcids"] == RPCMethod.DELETE_NOTE.value
 
-    @pytest.mark.asyncio
-    async def test_list_mind_maps(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.usefixtures("notes_and_mind_maps_response")
+    async def test_list_mind_maps(self, client):
         """Test listing mind maps in a notebook."""
-        response = build_rpc_response(
-            RPCMethod.GET_NOTES_AND_MIND_MAPS,
-            [
-                [
-                    ["note_001", ["note_001", "Regular note", None, None, "Note"]],
-                    [
-                        "mm_001",
-                        ["mm_001", '{"title":"Mind Map 1","children":[]}', None, None, "MM1"],
-                    ],
-                    ["mm_002", ["mm_002", '{"nodes":[{"id":"1"}]}', None, None, "MM2"]],
-                ]
-            ],
-        )
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            mind_maps = await client.notes.list_mind_maps("nb_123")
+        mind_maps = await client.notes.list_mind_maps("nb_123")
 
         assert len(mind_maps) == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_delete_mind_map(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         """Test deleting a mind map."""
         response = build_rpc_response(RPCMethod.DELETE_NOTE, None)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.notes.delete_mind_map("nb_123", "mm_001")
+        result = await client.notes.delete_mind_map("nb_123", "mm_001")
 
         assert result is True
         request = httpx_mock.get_request()
-        assert RPCMethod.DELETE_NOTE in str(request.url)
+        assert request.url.params["rpcids"] == RPCMethod.DELETE_NOTE.value
@@ -3,119 +3,86 @@
 import pytest
 from pytest_httpx import HTTPXMock
 
-from notebooklm import NotebookLMClient
-
 
 class TestResearchAPI:
     """Integration tests for the ResearchAPI."""
 
-    @pytest.mark.asyncio
-    async def test_start_fast_web_research(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test starting fast web research."""
-        response = build_rpc_response("Ljjv0c", ["task_123", "report_456"])
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.research.start(
-                "nb_123", "quantum computing", source="web", mode="fast"
-            )
-
-        assert result is not None
-        assert result["task_id"] == "task_123"
-        assert result["report_id"] == "report_456"
-        assert result["mode"] == "fast"
-
-        request = httpx_mock.get_request()
-        assert "Ljjv0c" in str(request.url)
-
-    @pytest.mark.asyncio
-    async def test_start_fast_drive_research(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test starting fast drive research."""
-        response = build_rpc_response("Ljjv0c", ["task_789", None])
-        httpx_mock.add_response(content=response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.research.start(
-                "nb_123", "project docs", source="drive", mode="fast"
-            )
-
-        assert result is not None
-        assert result["task_id"] == "task_789"
-        assert result["mode"] == "fast"
-
-    @pytest.mark.asyncio
-    async def test_start_deep_web_research(
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize(
+        ("rpc_id", "query", "source", "mode", "task_id", "report_id"),
+        [
+            ("Ljjv0c", "quantum computing", "web", "fast", "task_123", "report_456"),
+            ("Ljjv0c", "project docs", "drive", "fast", "task_789", None),
+            ("QA9ei", "AI ethics", "web", "deep", "task_deep", "report_deep"),
+        ],
+        ids=["fast_web", "fast_drive", "deep_web"],
+    )
+    async def test_start_research(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
+        rpc_id,
+        query,
+        source,
+        mode,
+        task_id,
+        report_id,
     ):
-        """Test starting deep web research."""
-        response = build_rpc_response("QA9ei", ["task_deep", "report_deep"])
-        httpx_mock.add_response(content=response.encode())
+        """Test starting research for each supported source/mode pair."""
+        response = build_rpc_response(rpc_id, [task_id, report_id])
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.research.start("nb_123", "AI ethics", source="web", mode="deep")
+        result = await client.research.start("nb_123", query, source=source, mode=mode)
 
         assert result is not None
-        assert result["mode"] == "deep"
+        assert result["task_id"] == task_id
+        assert result["report_id"] == report_id
+        assert result["mode"] == mode
 
         request = httpx_mock.get_request()
-        assert "QA9ei" in str(request.url)
+        assert request.url.params["rpcids"] == rpc_id
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_start_deep_drive_research_raises(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
     ):
         """Test that deep research on drive raises ValidationError."""
         from notebooklm.exceptions import ValidationError
 
-        async with NotebookLMClient(auth_tokens) as client:
-            with pytest.raises(ValidationError, match="Deep Research only supports Web"):
-                await client.research.start("nb_123", "query", source="drive", mode="deep")
+        with pytest.raises(ValidationError, match="Deep Research only supports Web"):
+            await client.research.start("nb_123", "query", source="drive", mode="deep")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_start_invalid_source_raises(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
     ):
         """Test that invalid source raises ValidationError."""
         from notebooklm.exceptions import ValidationError
 
-        async with NotebookLMClient(auth_tokens) as client:
-            with pytest.raises(ValidationError, match="Invalid source"):
-                await client.research.start("nb_123", "query", source="invalid")
+        with pytest.raises(ValidationError, match="Invalid source"):
+            await client.research.start("nb_123", "query", source="invalid")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_start_invalid_mode_raises(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
     ):
         """Test that invalid mode raises ValidationError."""
         from notebooklm.exceptions import ValidationError
 
-        async with NotebookLMClient(auth_tokens) as client:
-            with pytest.raises(ValidationError, match="Invalid mode"):
-                await client.research.start("nb_123", "query", mode="invalid")
+        with pytest.raises(ValidationError, match="Invalid mode"):
+            await client.research.start("nb_123", "query", mode="invalid")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_poll_completed(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -141,10 +108,9 @@ class TestResearchAPI:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.research.poll("nb_123")
+        result = await client.research.poll("nb_123")
 
         assert result["status"] == "completed"
         assert result["task_id"] == "task_123"
@@ -153,10 +119,10 @@ class TestResearchAPI:
         assert result["sources"][0]["title"] == "Quantum Guide"
         assert "Summary" in result["summary"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_poll_in_progress(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -176,34 +142,32 @@ class TestResearchAPI:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.research.poll("nb_123")
+        result = await client.research.poll("nb_123")
 
         assert result["status"] == "in_progress"
         assert result["task_id"] == "task_456"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_poll_no_research(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
         """Test polling when no research exists."""
         response = build_rpc_response("e3bVqc", [])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.research.poll("nb_123")
+        result = await client.research.poll("nb_123")
 
         assert result["status"] == "no_research"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_import_sources(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -217,30 +181,28 @@ class TestResearchAPI:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            sources_to_import = [
-                {"url": "https://example.com/quantum", "title": "Quantum Computing Guide"},
-                {"url": "https://example.com/ai", "title": "AI Research Paper"},
-            ]
-            result = await client.research.import_sources("nb_123", "task_123", sources_to_import)
+        sources_to_import = [
+            {"url": "https://example.com/quantum", "title": "Quantum Computing Guide"},
+            {"url": "https://example.com/ai", "title": "AI Research Paper"},
+        ]
+        result = await client.research.import_sources("nb_123", "task_123", sources_to_import)
 
         assert len(result) == 2
         assert result[0]["id"] == "src_001"
         assert result[0]["title"] == "Quantum Computing Guide"
 
         request = httpx_mock.get_request()
-        assert "LBwxtb" in str(request.url)
+        assert request.url.params["rpcids"] == "LBwxtb"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_import_sources_empty(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
     ):
         """Test importing empty sources list."""
-        async with NotebookLMClient(auth_tokens) as client:
-            result = await client.research.import_sources("nb_123", "task_123", [])
+        result = await client.research.import_sources("nb_123", "task_123", [])
 
         assert result == []
@@ -22,7 +22,7 @@ class TestSettingsAPI:
             [True, None, None, True, ["zh_Hans"]],  # Settings with language
         ]
         response = build_rpc_response(RPCMethod.SET_USER_SETTINGS, response_data)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.settings.set_output_language("zh_Hans")
@@ -40,7 +40,7 @@ class TestSettingsAPI:
             [True, None, None, True, ["en"]],
         ]
         response = build_rpc_response(RPCMethod.SET_USER_SETTINGS, response_data)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.settings.set_output_language("en")
@@ -61,7 +61,7 @@ class TestSettingsAPI:
             ]
         ]
         response = build_rpc_response(RPCMethod.GET_USER_SETTINGS, response_data)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.settings.get_output_language()
@@ -82,7 +82,7 @@ class TestSettingsAPI:
             ]
         ]
         response = build_rpc_response(RPCMethod.GET_USER_SETTINGS, response_data)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.settings.get_output_language()
@@ -97,7 +97,7 @@ class TestSettingsAPI:
         # Malformed response - missing expected structure
         response_data = [[None, None]]  # Missing settings element
         response = build_rpc_response(RPCMethod.GET_USER_SETTINGS, response_data)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.settings.get_output_language()
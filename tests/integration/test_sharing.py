@@ -3,17 +3,34 @@
 import pytest
 from pytest_httpx import HTTPXMock
 
-from notebooklm import NotebookLMClient, SharePermission, ShareViewLevel
+from conftest import NB123_SOURCE_PATH
+from notebooklm import SharePermission, ShareViewLevel
+from notebooklm._sharing import SharingAPI
 from notebooklm.rpc import RPCMethod
 
+# Share-status user entry for the notebook owner
+OWNER = ["owner@example.com", 1, [], ["Owner", "https://avatar"]]
+
+
+@pytest.fixture(scope="module")
+def share_ok_bytes(build_rpc_response):
+    """Encoded empty SHARE_NOTEBOOK reply."""
+    return build_rpc_response(RPCMethod.SHARE_NOTEBOOK, [])
+
+
+@pytest.fixture(scope="module")
+def owner_only_status_bytes(build_rpc_response):
+    """Encoded GET_SHARE_STATUS reply for a private notebook shared with nobody."""
+    return build_rpc_response(RPCMethod.GET_SHARE_STATUS, [[OWNER], [False], 1000])
+
 
 class TestGetShareStatus:
     """Tests for SharingAPI.get_status()."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_status_public_notebook(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -29,10 +46,9 @@ class TestGetShareStatus:
                 1000,
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.get_status("nb_123")
+        status = await client.sharing.get_status("nb_123")
 
         assert status.notebook_id == "nb_123"
         assert status.is_public is True
@@ -40,34 +56,25 @@ class TestGetShareStatus:
         assert status.shared_users[0].email == "owner@example.com"
         assert status.share_url == "https://notebooklm.google.com/notebook/nb_123"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_status_private_notebook(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
-        build_rpc_response,
+        owner_only_status_bytes,
     ):
         """Test getting status for a private notebook."""
-        response = build_rpc_response(
-            RPCMethod.GET_SHARE_STATUS,
-            [
-                [["owner@example.com", 1, [], ["Owner", "https://avatar"]]],
-                [False],
-                1000,
-            ],
-        )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=owner_only_status_bytes)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.get_status("nb_123")
+        status = await client.sharing.get_status("nb_123")
 
         assert status.is_public is False
         assert status.share_url is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_get_status_request_format(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
     ):
@@ -76,238 +83,184 @@ class TestGetShareStatus:
             RPCMethod.GET_SHARE_STATUS,
             [[], [False], 1000],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            await client.sharing.get_status("nb_123")
+        await client.sharing.get_status("nb_123")
 
         request = httpx_mock.get_request()
-        assert RPCMethod.GET_SHARE_STATUS.value in str(request.url)
-        assert "source-path=%2Fnotebook%2Fnb_123" in str(request.url)
+        assert request.url.params["rpcids"] == RPCMethod.GET_SHARE_STATUS.value
+        assert request.url.params["source-path"] == NB123_SOURCE_PATH
 
 
 class TestSetPublic:
     """Tests for SharingAPI.set_public()."""
 
-    @pytest.mark.asyncio
-    async def test_set_public_true(
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("is_public", [True, False], ids=["public", "private"])
+    async def test_set_public(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
+        share_ok_bytes,
+        is_public,
     ):
-        """Test enabling public sharing."""
+        """Test enabling and disabling public sharing."""
         # First call: SHARE_NOTEBOOK (returns empty)
-        share_response = build_rpc_response(RPCMethod.SHARE_NOTEBOOK, [])
-        httpx_mock.add_response(content=share_response.encode())
+        httpx_mock.add_response(content=share_ok_bytes)
 
         # Second call: GET_SHARE_STATUS (returns updated status)
         status_response = build_rpc_response(
             RPCMethod.GET_SHARE_STATUS,
-            [[["owner@example.com", 1, [], ["Owner", "https://avatar"]]], [True], 1000],
+            [[OWNER], [is_public], 1000],
         )
-        httpx_mock.add_response(content=status_response.encode())
+        httpx_mock.add_response(content=status_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.set_public("nb_123", True)
+        status = await client.sharing.set_public("nb_123", is_public)
 
-        assert status.is_public is True
-        assert status.share_url is not None
+        assert status.is_public is is_public
+        assert (status.share_url is not None) is is_public
 
         # Verify the SHARE_NOTEBOOK request
         requests = httpx_mock.get_requests()
         assert len(requests) == 2
-        assert RPCMethod.SHARE_NOTEBOOK.value in str(requests[0].url)
-
-    @pytest.mark.asyncio
-    async def test_set_public_false(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test disabling public sharing."""
-        share_response = build_rpc_response(RPCMethod.SHARE_NOTEBOOK, [])
-        httpx_mock.add_response(content=share_response.encode())
-
-        status_response = build_rpc_response(
-            RPCMethod.GET_SHARE_STATUS,
-            [[["owner@example.com", 1, [], ["Owner", "https://avatar"]]], [False], 1000],
-        )
-        httpx_mock.add_response(content=status_response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.set_public("nb_123", False)
-
-        assert status.is_public is False
-        assert status.share_url is None
+        assert requests[0].url.params["rpcids"] == RPCMethod.SHARE_NOTEBOOK.value
 
 
 class TestSetViewLevel:
     """Tests for SharingAPI.set_view_level()."""
 
-    @pytest.mark.asyncio
-    async def test_set_view_level_chat_only(
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize(
+        "level",
+        [ShareViewLevel.CHAT_ONLY, ShareViewLevel.FULL_NOTEBOOK],
+        ids=["chat_only", "full_notebook"],
+    )
+    async def test_set_view_level(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
-        build_rpc_response,
+        rename_notebook_ok_bytes,
+        owner_only_status_bytes,
+        level,
     ):
-        """Test setting view level to chat only."""
+        """Test setting each view level."""
         # First call: RENAME_NOTEBOOK (to set view level)
-        rename_response = build_rpc_response(RPCMethod.RENAME_NOTEBOOK, None)
-        httpx_mock.add_response(content=rename_response.encode())
+        httpx_mock.add_response(content=rename_notebook_ok_bytes)
 
         # Second call: GET_SHARE_STATUS (to get current status)
-        status_response = build_rpc_response(
-            RPCMethod.GET_SHARE_STATUS,
-            [[["owner@example.com", 1, [], ["Owner", "https://avatar"]]], [False], 1000],
-        )
-        httpx_mock.add_response(content=status_response.encode())
+        httpx_mock.add_response(content=owner_only_status_bytes)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.set_view_level("nb_123", ShareViewLevel.CHAT_ONLY)
+        status = await client.sharing.set_view_level("nb_123", level)
 
         # Verify the returned status has the correct view_level we set
-        assert status.view_level == ShareViewLevel.CHAT_ONLY
+        assert status.view_level == level
 
         requests = httpx_mock.get_requests()
         assert len(requests) == 2
-        assert RPCMethod.RENAME_NOTEBOOK.value in str(requests[0].url)
-        assert RPCMethod.GET_SHARE_STATUS.value in str(requests[1].url)
-
-    @pytest.mark.asyncio
-    async def test_set_view_level_full_notebook(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-        build_rpc_response,
-    ):
-        """Test setting view level to full notebook."""
-        # First call: RENAME_NOTEBOOK (to set view level)
-        rename_response = build_rpc_response(RPCMethod.RENAME_NOTEBOOK, None)
-        httpx_mock.add_response(content=rename_response.encode())
-
-        # Second call: GET_SHARE_STATUS (to get current status)
-        status_response = build_rpc_response(
-            RPCMethod.GET_SHARE_STATUS,
-            [[["owner@example.com", 1, [], ["Owner", "https://avatar"]]], [False], 1000],
-        )
-        httpx_mock.add_response(content=status_response.encode())
-
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.set_view_level("nb_123", ShareViewLevel.FULL_NOTEBOOK)
-
-        # Verify the returned status has the correct view_level we set
-        assert status.view_level == ShareViewLevel.FULL_NOTEBOOK
-
-        requests = httpx_mock.get_requests()
-        assert len(requests) == 2
-        assert RPCMethod.RENAME_NOTEBOOK.value in str(requests[0].url)
+        assert requests[0].url.params["rpcids"] == RPCMethod.RENAME_NOTEBOOK.value
+        assert requests[1].url.params["rpcids"] == RPCMethod.GET_SHARE_STATUS.value
 
 
 class TestAddUser:
     """Tests for SharingAPI.add_user()."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_add_user_as_viewer(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
+        share_ok_bytes,
     ):
         """Test adding a user as viewer."""
-        share_response = build_rpc_response(RPCMethod.SHARE_NOTEBOOK, [])
-        httpx_mock.add_response(content=share_response.encode())
+        httpx_mock.add_response(content=share_ok_bytes)
 
         status_response = build_rpc_response(
             RPCMethod.GET_SHARE_STATUS,
             [
                 [
-                    ["owner@example.com", 1, [], ["Owner", "https://avatar"]],
+                    OWNER,
                     ["new@example.com", 3, [], ["New User", "https://new.avatar"]],
                 ],
                 [False],
                 1000,
             ],
         )
-        httpx_mock.add_response(content=status_response.encode())
+        httpx_mock.add_response(content=status_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.add_user(
-                "nb_123",
-                "new@example.com",
-                SharePermission.VIEWER,
-                notify=True,
-            )
+        status = await client.sharing.add_user(
+            "nb_123",
+            "new@example.com",
+            SharePermission.VIEWER,
+            notify=True,
+        )
 
         assert len(status.shared_users) == 2
         assert status.shared_users[1].email == "new@example.com"
         assert status.shared_users[1].permission == SharePermission.VIEWER
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_add_user_as_editor(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
+        share_ok_bytes,
     ):
         """Test adding a user as editor."""
-        share_response = build_rpc_response(RPCMethod.SHARE_NOTEBOOK, [])
-        httpx_mock.add_response(content=share_response.encode())
+        httpx_mock.add_response(content=share_ok_bytes)
 
         status_response = build_rpc_response(
             RPCMethod.GET_SHARE_STATUS,
             [
                 [
-                    ["owner@example.com", 1, [], ["Owner", "https://avatar"]],
+                    OWNER,
                     ["editor@example.com", 2, [], ["Editor", "https://editor.avatar"]],
                 ],
                 [False],
                 1000,
             ],
         )
-        httpx_mock.add_response(content=status_response.encode())
+        httpx_mock.add_response(content=status_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.add_user(
-                "nb_123",
-                "editor@example.com",
-                SharePermission.EDITOR,
-            )
+        status = await client.sharing.add_user(
+            "nb_123",
+            "editor@example.com",
+            SharePermission.EDITOR,
+        )
 
         assert status.shared_users[1].permission == SharePermission.EDITOR
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_add_user_with_welcome_message(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
+        share_ok_bytes,
     ):
         """Test adding a user with a welcome message."""
-        share_response = build_rpc_response(RPCMethod.SHARE_NOTEBOOK, [])
-        httpx_mock.add_response(content=share_response.encode())
+        httpx_mock.add_response(content=share_ok_bytes)
 
         status_response = build_rpc_response(
             RPCMethod.GET_SHARE_STATUS,
             [
                 [
-                    ["owner@example.com", 1, [], ["Owner", "https://avatar"]],
+                    OWNER,
                     ["new@example.com", 3, [], ["New User", "https://avatar"]],
                 ],
                 [False],
                 1000,
             ],
         )
-        httpx_mock.add_response(content=status_response.encode())
+        httpx_mock.add_response(content=status_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.add_user(
-                "nb_123",
-                "new@example.com",
-                welcome_message="Welcome to my notebook!",
-            )
+        status = await client.sharing.add_user(
+            "nb_123",
+            "new@example.com",
+            welcome_message="Welcome to my notebook!",
+        )
 
         assert len(status.shared_users) == 2
 
@@ -315,36 +268,35 @@ class TestAddUser:
 class TestUpdateUser:
     """Tests for SharingAPI.update_user()."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_update_user_permission(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
         build_rpc_response,
+        share_ok_bytes,
     ):
         """Test updating a user's permission."""
-        share_response = build_rpc_response(RPCMethod.SHARE_NOTEBOOK, [])
-        httpx_mock.add_response(content=share_response.encode())
+        httpx_mock.add_response(content=share_ok_bytes)
 
         status_response = build_rpc_response(
             RPCMethod.GET_SHARE_STATUS,
             [
                 [
-                    ["owner@example.com", 1, [], ["Owner", "https://avatar"]],
+                    OWNER,
                     ["user@example.com", 2, [], ["User", "https://avatar"]],  # Now editor
                 ],
                 [False],
                 1000,
             ],
         )
-        httpx_mock.add_response(content=status_response.encode())
+        httpx_mock.add_response(content=status_response)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.update_user(
-                "nb_123",
-                "user@example.com",
-                SharePermission.EDITOR,
-            )
+        status = await client.sharing.update_user(
+            "nb_123",
+            "user@example.com",
+            SharePermission.EDITOR,
+        )
 
         assert status.shared_users[1].permission == SharePermission.EDITOR
 
@@ -352,30 +304,21 @@ class TestUpdateUser:
 class TestRemoveUser:
     """Tests for SharingAPI.remove_user()."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_remove_user(
         self,
-        auth_tokens,
+        client,
         httpx_mock: HTTPXMock,
-        build_rpc_response,
+        share_ok_bytes,
+        owner_only_status_bytes,
     ):
         """Test removing a user."""
-        share_response = build_rpc_response(RPCMethod.SHARE_NOTEBOOK, [])
-        httpx_mock.add_response(content=share_response.encode())
+        httpx_mock.add_response(content=share_ok_bytes)
 
         # After removal, only owner remains
-        status_response = build_rpc_response(
-            RPCMethod.GET_SHARE_STATUS,
-            [
-                [["owner@example.com", 1, [], ["Owner", "https://avatar"]]],
-                [False],
-                1000,
-            ],
-        )
-        httpx_mock.add_response(content=status_response.encode())
+        httpx_mock.add_response(content=owner_only_status_bytes)
 
-        async with NotebookLMClient(auth_tokens) as client:
-            status = await client.sharing.remove_user("nb_123", "removed@example.com")
+        status = await client.sharing.remove_user("nb_123", "removed@example.com")
 
         assert len(status.shared_users) == 1
         assert status.shared_users[0].email == "owner@example.com"
@@ -384,18 +327,15 @@ class TestRemoveUser:
 class TestSharingAPIIntegration:
     """Additional integration tests for SharingAPI."""
 
-    @pytest.mark.asyncio
-    async def test_client_has_sharing_attribute(
-        self,
-        auth_tokens,
-        httpx_mock: HTTPXMock,
-    ):
+    def test_client_has_sharing_attribute(self, sync_client):
         """Test that NotebookLMClient has sharing API."""
-        async with NotebookLMClient(auth_tokens) as client:
-            assert hasattr(client, "sharing")
-            assert hasattr(client.sharing, "get_status")
-            assert hasattr(client.sharing, "set_public")
-            assert hasattr(client.sharing, "set_view_level")
-            assert hasattr(client.sharing, "add_user")
-            assert hasattr(client.sharing, "update_user")
-            assert hasattr(client.sharing, "remove_user")
+        expected = {
+            "get_status",
+            "set_public",
+            "set_view_level",
+            "add_user",
+            "update_user",
+            "remove_user",
+        }
+        assert isinstance(sync_client.sharing, SharingAPI)
+        assert expected <= set(vars(SharingAPI))
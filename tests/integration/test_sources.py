@@ -31,7 +31,7 @@ class TestAddSource:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             source = await client.sources.add_url("nb_123", "https://example.com")
@@ -50,7 +50,7 @@ class TestAddSource:
         response = build_rpc_response(
             RPCMethod.ADD_SOURCE, [[[["source_id"], "My Document", [None, 11], [None, 2]]]]
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             source = await client.sources.add_text("nb_123", "My Document", "This is the content")
@@ -69,7 +69,7 @@ class TestDeleteSource:
         build_rpc_response,
     ):
         response = build_rpc_response(RPCMethod.DELETE_SOURCE, [True])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.sources.delete("nb_123", "source_456")
@@ -84,7 +84,7 @@ class TestDeleteSource:
         build_rpc_response,
     ):
         response = build_rpc_response(RPCMethod.DELETE_SOURCE, [True])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             await client.sources.delete("nb_123", "source_456")
@@ -132,7 +132,7 @@ class TestGetSource:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             source = await client.sources.get("nb_123", "source_456")
@@ -200,7 +200,7 @@ class TestSourcesAPI:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             sources = await client.sources.list("nb_123")
@@ -232,7 +232,7 @@ class TestSourcesAPI:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             sources = await client.sources.list("nb_123")
@@ -260,7 +260,7 @@ class TestSourcesAPI:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             source = await client.sources.get("nb_123", "nonexistent")
@@ -279,7 +279,7 @@ class TestSourcesAPI:
             RPCMethod.ADD_SOURCE,
             [[[["drive_001"], "My Doc", [None, 0], [None, 2]]]],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             source = await client.sources.add_drive(
@@ -302,7 +302,7 @@ class TestSourcesAPI:
     ):
         """Test refreshing a source."""
         response = build_rpc_response(RPCMethod.REFRESH_SOURCE, None)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             result = await client.sources.refresh("nb_123", "src_001")
@@ -320,7 +320,7 @@ class TestSourcesAPI:
     ):
         """Test checking freshness - source is fresh (explicit True)."""
         response = build_rpc_response("yR9Yof", True)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             is_fresh = await client.sources.check_freshness("nb_123", "src_001")
@@ -341,7 +341,7 @@ class TestSourcesAPI:
         """
         # Real API returns empty array for fresh sources
         response = build_rpc_response("yR9Yof", [])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             is_fresh = await client.sources.check_freshness("nb_123", "src_001")
@@ -362,7 +362,7 @@ class TestSourcesAPI:
         """
         # Real API returns nested structure for Drive sources
         response = build_rpc_response("yR9Yof", [[None, True, ["src_001"]]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             is_fresh = await client.sources.check_freshness("nb_123", "src_001")
@@ -378,7 +378,7 @@ class TestSourcesAPI:
     ):
         """Test checking freshness - source is stale."""
         response = build_rpc_response("yR9Yof", False)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             is_fresh = await client.sources.check_freshness("nb_123", "src_001")
@@ -407,7 +407,7 @@ class TestSourcesAPI:
                 ]
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             guide = await client.sources.get_guide("nb_123", "src_001")
@@ -427,7 +427,7 @@ class TestSourcesAPI:
         """Test getting guide for source with no AI analysis."""
         # Real API returns 3 levels of nesting even for empty responses
         response = build_rpc_response(RPCMethod.GET_SOURCE_GUIDE, [[[None, [], [], []]]])
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             guide = await client.sources.get_guide("nb_123", "src_001")
@@ -444,7 +444,7 @@ class TestSourcesAPI:
     ):
         """Test renaming a source."""
         response = build_rpc_response("b7Wfje", None)
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             source = await client.sources.rename("nb_123", "src_001", "New Title")
@@ -478,7 +478,7 @@ class TestAddFileSource:
         )
         httpx_mock.add_response(
             url=re.compile(r".*batchexecute.*"),
-            content=rpc_response.encode(),
+            content=rpc_response,
         )
 
         # Step 2: Mock upload session start response
@@ -537,7 +537,7 @@ class TestAddFileSource:
             RPCMethod.ADD_SOURCE_FILE,
             [[[[" src_id"], "my_file.pdf", [None, None, None, None, 0]]]],
         )
-        httpx_mock.add_response(url=re.compile(r".*batchexecute.*"), content=rpc_response.encode())
+        httpx_mock.add_response(url=re.compile(r".*batchexecute.*"), content=rpc_response)
         httpx_mock.add_response(
             url=re.compile(r".*upload/_/\?authuser=0$"),
             headers={"x-goog-upload-url": "https://notebooklm.google.com/upload/_/?upload_id=x"},
@@ -588,7 +588,7 @@ class TestAddFileSource:
             RPCMethod.ADD_SOURCE_FILE,
             [[[["src_abc"], "document.txt", [None, None, None, None, 0]]]],
         )
-        httpx_mock.add_response(url=re.compile(r".*batchexecute.*"), content=rpc_response.encode())
+        httpx_mock.add_response(url=re.compile(r".*batchexecute.*"), content=rpc_response)
         httpx_mock.add_response(
             url=re.compile(r".*upload/_/\?authuser=0$"),
             headers={"x-goog-upload-url": "https://notebooklm.google.com/upload/_/?upload_id=y"},
@@ -630,7 +630,7 @@ class TestAddFileSource:
             RPCMethod.ADD_SOURCE_FILE,
             [[[["src_bin"], "binary_file.bin", [None, None, None, None, 0]]]],
         )
-        httpx_mock.add_response(url=re.compile(r".*batchexecute.*"), content=rpc_response.encode())
+        httpx_mock.add_response(url=re.compile(r".*batchexecute.*"), content=rpc_response)
         httpx_mock.add_response(
             url=re.compile(r".*upload/_/\?authuser=0$"),
             headers={"x-goog-upload-url": "https://notebooklm.google.com/upload/_/?upload_id=z"},
@@ -677,7 +677,7 @@ class TestGetFulltext:
                 ],
             ],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             fulltext = await client.sources.get_fulltext("nb_123", "source_123")
@@ -705,7 +705,7 @@ class TestGetFulltext:
             RPCMethod.GET_SOURCE,
             [["src_456", "Title", []], None, None, [[["Content here"]]]],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             await client.sources.get_fulltext("nb_123", "src_456")
@@ -733,7 +733,7 @@ class TestGetFulltext:
             RPCMethod.GET_SOURCE,
             [["src_empty", "Empty Source", []], None, None, None],
         )
-        httpx_mock.add_response(content=response.encode())
+        httpx_mock.add_response(content=response)
 
         async with NotebookLMClient(auth_tokens) as client:
             fulltext = await client.sources.get_fulltext("nb_123", "src_empty")
@@ -14,10 +14,11 @@ Note: These tests are automatically skipped if cassettes are not available.
 """
 
 import csv
+import io
 import json
 import os
 import sys
-from contextlib import asynccontextmanager
+from operator import attrgetter
 from pathlib import Path
 
 import pytest
@@ -25,8 +26,8 @@ import pytest
 # Add tests directory to path for vcr_config import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent))
-from conftest import get_vcr_auth, skip_no_cassettes
-from notebooklm import NotebookLMClient, ReportFormat
+from conftest import skip_no_cassettes
+from notebooklm import ReportFormat, SourceType
 from vcr_config import notebooklm_vcr
 
 # Skip all tests in this module if cassettes are not available
@@ -37,18 +38,10 @@ pytestmark = [pytest.mark.vcr, skip_no_cassettes]
 READONLY_NOTEBOOK_ID = os.environ.get("NOTEBOOKLM_READ_ONLY_NOTEBOOK_ID", "")
 MUTABLE_NOTEBOOK_ID = os.environ.get("NOTEBOOKLM_GENERATION_NOTEBOOK_ID", "")
 
-
-# =============================================================================
-# Helper for reducing boilerplate
-# =============================================================================
-
-
-@asynccontextmanager
-async def vcr_client():
-    """Context manager for creating authenticated VCR client."""
-    auth = await get_vcr_auth()
-    async with NotebookLMClient(auth) as client:
-        yield client
+# xdist groups for `--dist loadgroup`: classes that touch the mutable notebook
+# (or account settings) stay on one worker, read-only classes can run elsewhere
+readonly_group = pytest.mark.xdist_group(name="vcr_readonly")
+mutable_group = pytest.mark.xdist_group(name="vcr_mutable")
 
 
 # =============================================================================
@@ -56,66 +49,61 @@ async def vcr_client():
 # =============================================================================
 
 
+@mutable_group
 class TestNotebooksAPI:
     """Notebooks API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notebooks_list.yaml")
-    async def test_list(self):
+    async def test_list(self, vcr_client):
         """List all notebooks."""
-        async with vcr_client() as client:
-            notebooks = await client.notebooks.list()
+        notebooks = await vcr_client.notebooks.list()
         assert isinstance(notebooks, list)
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notebooks_get.yaml")
-    async def test_get(self):
+    async def test_get(self, vcr_client):
         """Get a specific notebook."""
-        async with vcr_client() as client:
-            notebook = await client.notebooks.get(READONLY_NOTEBOOK_ID)
+        notebook = await vcr_client.notebooks.get(READONLY_NOTEBOOK_ID)
         assert notebook is not None
         if READONLY_NOTEBOOK_ID:
             assert notebook.id == READONLY_NOTEBOOK_ID
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notebooks_get_summary.yaml")
-    async def test_get_summary(self):
+    async def test_get_summary(self, vcr_client):
         """Get notebook summary."""
-        async with vcr_client() as client:
-            summary = await client.notebooks.get_summary(READONLY_NOTEBOOK_ID)
+        summary = await vcr_client.notebooks.get_summary(READONLY_NOTEBOOK_ID)
         assert summary is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notebooks_get_description.yaml")
-    async def test_get_description(self):
+    async def test_get_description(self, vcr_client):
         """Get notebook description."""
-        async with vcr_client() as client:
-            description = await client.notebooks.get_description(READONLY_NOTEBOOK_ID)
+        description = await vcr_client.notebooks.get_description(READONLY_NOTEBOOK_ID)
         assert description is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notebooks_get_raw.yaml")
-    async def test_get_raw(self):
+    async def test_get_raw(self, vcr_client):
         """Get raw notebook data."""
-        async with vcr_client() as client:
-            raw = await client.notebooks.get_raw(READONLY_NOTEBOOK_ID)
+        raw = await vcr_client.notebooks.get_raw(READONLY_NOTEBOOK_ID)
         assert raw is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notebooks_rename.yaml")
-    async def test_rename(self):
+    async def test_rename(self, vcr_client):
         """Rename a notebook (then rename back)."""
-        async with vcr_client() as client:
-            notebook = await client.notebooks.get(MUTABLE_NOTEBOOK_ID)
-            original_name = notebook.title
-            await client.notebooks.rename(MUTABLE_NOTEBOOK_ID, "VCR Test Renamed")
-            await client.notebooks.rename(MUTABLE_NOTEBOOK_ID, original_name)
+        notebook = await vcr_client.notebooks.get(MUTABLE_NOTEBOOK_ID)
+        original_name = notebook.title
+        await vcr_client.notebooks.rename(MUTABLE_NOTEBOOK_ID, "VCR Test Renamed")
+        await vcr_client.notebooks.rename(MUTABLE_NOTEBOOK_ID, original_name)
 
 
 # =============================================================================
@@ -123,28 +111,27 @@ class TestNotebooksAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestSourcesAPI:
     """Sources API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_list.yaml")
-    async def test_list(self):
+    async def test_list(self, vcr_client):
         """List sources in a notebook."""
-        async with vcr_client() as client:
-            sources = await client.sources.list(READONLY_NOTEBOOK_ID)
+        sources = await vcr_client.sources.list(READONLY_NOTEBOOK_ID)
         assert isinstance(sources, list)
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_get_guide.yaml")
-    async def test_get_guide(self):
+    async def test_get_guide(self, vcr_client):
         """Get source guide for a specific source."""
-        async with vcr_client() as client:
-            sources = await client.sources.list(READONLY_NOTEBOOK_ID)
-            if not sources:
-                pytest.skip("No sources available")
-            guide = await client.sources.get_guide(READONLY_NOTEBOOK_ID, sources[0].id)
+        sources = await vcr_client.sources.list(READONLY_NOTEBOOK_ID)
+        if not sources:
+            pytest.skip("No sources available")
+        guide = await vcr_client.sources.get_guide(READONLY_NOTEBOOK_ID, sources[0].id)
         assert guide is not None
         # Verify values are actually populated (catches parsing bugs like issue #70)
         assert guide["summary"], "Expected non-empty summary from source guide"
@@ -152,15 +139,14 @@ class TestSourcesAPI:
         assert len(guide["keywords"]) > 0, "Expected non-empty keywords from source guide"
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_get_fulltext.yaml")
-    async def test_get_fulltext(self):
+    async def test_get_fulltext(self, vcr_client):
         """Get source fulltext content."""
-        async with vcr_client() as client:
-            sources = await client.sources.list(READONLY_NOTEBOOK_ID)
-            if not sources:
-                pytest.skip("No sources available")
-            fulltext = await client.sources.get_fulltext(READONLY_NOTEBOOK_ID, sources[0].id)
+        sources = await vcr_client.sources.list(READONLY_NOTEBOOK_ID)
+        if not sources:
+            pytest.skip("No sources available")
+        fulltext = await vcr_client.sources.get_fulltext(READONLY_NOTEBOOK_ID, sources[0].id)
         assert fulltext is not None
         assert fulltext.source_id == sources[0].id
         # Verify content is actually populated (catches parsing bugs like issue #70)
@@ -169,51 +155,48 @@ class TestSourcesAPI:
         assert fulltext.char_count > 0, "Expected positive char_count"
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_add_text.yaml")
-    async def test_add_text(self):
+    async def test_add_text(self, vcr_client):
         """Add a text source."""
-        async with vcr_client() as client:
-            source = await client.sources.add_text(
-                MUTABLE_NOTEBOOK_ID,
-                title="VCR Test Source",
-                content="This is a test source created by VCR recording.",
-            )
+        source = await vcr_client.sources.add_text(
+            MUTABLE_NOTEBOOK_ID,
+            title="VCR Test Source",
+            content="This is a test source created by VCR recording.",
+        )
         assert source is not None
         assert source.title == "VCR Test Source"
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_add_url.yaml")
-    async def test_add_url(self):
+    async def test_add_url(self, vcr_client):
         """Add a URL source."""
-        async with vcr_client() as client:
-            source = await client.sources.add_url(
-                MUTABLE_NOTEBOOK_ID,
-                url="https://en.wikipedia.org/wiki/Artificial_intelligence",
-            )
+        source = await vcr_client.sources.add_url(
+            MUTABLE_NOTEBOOK_ID,
+            url="https://en.wikipedia.org/wiki/Artificial_intelligence",
+        )
         assert source is not None
         assert source.id, "Expected non-empty source ID"
         # Title may be extracted from the page
         assert source.title is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_add_drive.yaml")
-    async def test_add_drive(self):
+    async def test_add_drive(self, vcr_client):
         """Add a Google Drive document source.
 
         Uses a public Google Doc for testing. The add_drive() function
         uses single-wrapped params [source_data] (not double-wrapped).
         """
-        async with vcr_client() as client:
-            source = await client.sources.add_drive(
-                MUTABLE_NOTEBOOK_ID,
-                file_id="1oAk_INJHbIPsIh49jgNqj3FESSGHZrzxFY7t05Lvvl0",
-                title="VCR Test Drive Doc",
-                mime_type="application/vnd.google-apps.document",
-                wait=False,  # Don't wait for processing during VCR recording
-            )
+        source = await vcr_client.sources.add_drive(
+            MUTABLE_NOTEBOOK_ID,
+            file_id="1oAk_INJHbIPsIh49jgNqj3FESSGHZrzxFY7t05Lvvl0",
+            title="VCR Test Drive Doc",
+            mime_type="application/vnd.google-apps.document",
+            wait=False,  # Don't wait for processing during VCR recording
+        )
         assert source is not None
         assert source.id, "Expected non-empty source ID"
         # Drive sources use the actual document title, not the passed title
@@ -225,58 +208,55 @@ class TestSourcesAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestNotesAPI:
     """Notes API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notes_list.yaml")
-    async def test_list(self):
+    async def test_list(self, vcr_client):
         """List notes in a notebook."""
-        async with vcr_client() as client:
-            notes = await client.notes.list(READONLY_NOTEBOOK_ID)
+        notes = await vcr_client.notes.list(READONLY_NOTEBOOK_ID)
         assert isinstance(notes, list)
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notes_list_mind_maps.yaml")
-    async def test_list_mind_maps(self):
+    async def test_list_mind_maps(self, vcr_client):
         """List mind maps in a notebook."""
-        async with vcr_client() as client:
-            mind_maps = await client.notes.list_mind_maps(READONLY_NOTEBOOK_ID)
+        mind_maps = await vcr_client.notes.list_mind_maps(READONLY_NOTEBOOK_ID)
         assert isinstance(mind_maps, list)
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notes_create.yaml")
-    async def test_create(self):
+    async def test_create(self, vcr_client):
         """Create a note."""
-        async with vcr_client() as client:
-            note = await client.notes.create(
-                MUTABLE_NOTEBOOK_ID,
-                title="VCR Test Note",
-                content="This is a test note created by VCR recording.",
-            )
+        note = await vcr_client.notes.create(
+            MUTABLE_NOTEBOOK_ID,
+            title="VCR Test Note",
+            content="This is a test note created by VCR recording.",
+        )
         assert note is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notes_create_and_update.yaml")
-    async def test_create_and_update(self):
+    async def test_create_and_update(self, vcr_client):
         """Create and update a note."""
-        async with vcr_client() as client:
-            note = await client.notes.create(
-                MUTABLE_NOTEBOOK_ID,
-                title="VCR Update Test",
-                content="Original content.",
-            )
-            assert note is not None
-            await client.notes.update(
-                MUTABLE_NOTEBOOK_ID,
-                note.id,
-                title="VCR Update Test - Updated",
-                content="Updated content.",
-            )
+        note = await vcr_client.notes.create(
+            MUTABLE_NOTEBOOK_ID,
+            title="VCR Update Test",
+            content="Original content.",
+        )
+        assert note is not None
+        await vcr_client.notes.update(
+            MUTABLE_NOTEBOOK_ID,
+            note.id,
+            title="VCR Update Test - Updated",
+            content="Updated content.",
+        )
 
 
 # =============================================================================
@@ -285,7 +265,7 @@ class TestNotesAPI:
 
 
 # Artifact list method configurations: (method_name, cassette_name)
-ARTIFACT_LIST_METHODS = [
+ARTIFACT_LIST_METHODS = (
     ("list", "artifacts_list.yaml"),
     ("list_audio", "artifacts_list_audio.yaml"),
     ("list_video", "artifacts_list_video.yaml"),
@@ -295,178 +275,176 @@ ARTIFACT_LIST_METHODS = [
     ("list_infographics", "artifacts_list_infographics.yaml"),
     ("list_slide_decks", "artifacts_list_slide_decks.yaml"),
     ("list_data_tables", "artifacts_list_data_tables.yaml"),
-]
+)
 
 
+@readonly_group
 class TestArtifactsListAPI:
     """Artifacts API list operations - parametrized to reduce duplication."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("method_name,cassette", ARTIFACT_LIST_METHODS)
-    async def test_list_artifacts(self, method_name, cassette):
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize(
+        ("get_method", "cassette"),
+        [(attrgetter(f"artifacts.{name}"), cassette) for name, cassette in ARTIFACT_LIST_METHODS],
+        ids=[name for name, _ in ARTIFACT_LIST_METHODS],
+    )
+    async def test_list_artifacts(self, vcr_client, get_method, cassette):
         """Test artifact list methods."""
         with notebooklm_vcr.use_cassette(cassette):
-            async with vcr_client() as client:
-                method = getattr(client.artifacts, method_name)
-                if method_name == "list":
-                    result = await method(READONLY_NOTEBOOK_ID)
-                else:
-                    result = await method(READONLY_NOTEBOOK_ID)
-                assert isinstance(result, list)
+            result = await get_method(vcr_client)(READONLY_NOTEBOOK_ID)
+            assert isinstance(result, list)
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("artifacts_suggest_reports.yaml")
-    async def test_suggest_reports(self):
+    async def test_suggest_reports(self, vcr_client):
         """Get report suggestions."""
-        async with vcr_client() as client:
-            suggestions = await client.artifacts.suggest_reports(READONLY_NOTEBOOK_ID)
+        suggestions = await vcr_client.artifacts.suggest_reports(READONLY_NOTEBOOK_ID)
         assert isinstance(suggestions, list)
 
 
+def _check_markdown_report(output_path: Path) -> None:
+    content = output_path.read_bytes()
+    assert len(content) > 0 and b"#" in content
+
+
+def _check_mind_map_json(output_path: Path) -> None:
+    data = json.loads(output_path.read_bytes())
+    assert "name" in data
+
+
+def _check_data_table_csv(output_path: Path) -> None:
+    # Decode the bytes directly: read_text() would translate \r\n before csv sees it
+    text = output_path.read_bytes().decode("utf-8-sig")
+    rows = list(csv.reader(io.StringIO(text, newline="")))
+    assert len(rows) >= 1
+
+
+def _check_quiz_json(output_path: Path) -> None:
+    data = json.loads(output_path.read_bytes())
+    assert "title" in data
+    assert "questions" in data
+
+
+def _check_quiz_markdown(output_path: Path) -> None:
+    content = output_path.read_bytes()
+    assert b"# " in content  # Should have a heading
+    assert b"Question" in content or b"##" in content
+
+
+def _check_flashcards_json(output_path: Path) -> None:
+    data = json.loads(output_path.read_bytes())
+    assert "title" in data
+    assert "cards" in data
+    # Verify normalized format (front/back, not f/b)
+    if data["cards"]:
+        assert "front" in data["cards"][0]
+        assert "back" in data["cards"][0]
+
+
+def _check_flashcards_markdown(output_path: Path) -> None:
+    content = output_path.read_bytes()
+    assert b"# " in content  # Should have a heading
+    assert b"**Q:**" in content or b"Card" in content
+
+
+# Artifact download configurations:
+# (method_name, cassette_name, filename, kwargs, missing_error, check)
+ARTIFACT_DOWNLOAD_METHODS = (
+    (
+        "download_report",
+        "artifacts_download_report.yaml",
+        "report.md",
+        {},
+        "No completed report",
+        _check_markdown_report,
+    ),
+    (
+        "download_mind_map",
+        "artifacts_download_mind_map.yaml",
+        "mindmap.json",
+        {},
+        "No mind maps found",
+        _check_mind_map_json,
+    ),
+    (
+        "download_data_table",
+        "artifacts_download_data_table.yaml",
+        "data.csv",
+        {},
+        "No completed data table",
+        _check_data_table_csv,
+    ),
+    (
+        "download_quiz",
+        "artifacts_download_quiz.yaml",
+        "quiz.json",
+        {},
+        "No completed quiz",
+        _check_quiz_json,
+    ),
+    (
+        "download_quiz",
+        "artifacts_download_quiz_markdown.yaml",
+        "quiz.md",
+        {"output_format": "markdown"},
+        "No completed quiz",
+        _check_quiz_markdown,
+    ),
+    (
+        "download_flashcards",
+        "artifacts_download_flashcards.yaml",
+        "flashcards.json",
+        {},
+        "No completed flashcard",
+        _check_flashcards_json,
+    ),
+    (
+        "download_flashcards",
+        "artifacts_download_flashcards_markdown.yaml",
+        "flashcards.md",
+        {"output_format": "markdown"},
+        "No completed flashcard",
+        _check_flashcards_markdown,
+    ),
+)
+
+
+@readonly_group
 class TestArtifactsDownloadAPI:
-    """Artifacts API download operations."""
-
-    @pytest.mark.vcr
-    @pytest.mark.asyncio
-    @notebooklm_vcr.use_cassette("artifacts_download_report.yaml")
-    async def test_download_report(self, tmp_path):
-        """Download a report as markdown."""
-        async with vcr_client() as client:
-            output_path = tmp_path / "report.md"
-            try:
-                path = await client.artifacts.download_report(
-                    READONLY_NOTEBOOK_ID, str(output_path)
-                )
-                assert os.path.exists(path)
-                content = output_path.read_text(encoding="utf-8")
-                assert len(content) > 0 and "#" in content
-            except ValueError as e:
-                if "No completed report" in str(e):
-                    pytest.skip("No completed report artifact available")
-                raise
-
-    @pytest.mark.vcr
-    @pytest.mark.asyncio
-    @notebooklm_vcr.use_cassette("artifacts_download_mind_map.yaml")
-    async def test_download_mind_map(self, tmp_path):
-        """Download a mind map as JSON."""
-        async with vcr_client() as client:
-            output_path = tmp_path / "mindmap.json"
-            try:
-                path = await client.artifacts.download_mind_map(
-                    READONLY_NOTEBOOK_ID, str(output_path)
-                )
-                assert os.path.exists(path)
-                data = json.loads(output_path.read_text(encoding="utf-8"))
-                assert "name" in data
-            except ValueError as e:
-                if "No mind maps found" in str(e):
-                    pytest.skip("No mind map artifact available")
-                raise
-
-    @pytest.mark.vcr
-    @pytest.mark.asyncio
-    @notebooklm_vcr.use_cassette("artifacts_download_data_table.yaml")
-    async def test_download_data_table(self, tmp_path):
-        """Download a data table as CSV."""
-        async with vcr_client() as client:
-            output_path = tmp_path / "data.csv"
-            try:
-                path = await client.artifacts.download_data_table(
-                    READONLY_NOTEBOOK_ID, str(output_path)
-                )
-                assert os.path.exists(path)
-                with open(output_path, encoding="utf-8-sig") as f:
-                    rows = list(csv.reader(f))
-                assert len(rows) >= 1
-            except ValueError as e:
-                if "No completed data table" in str(e):
-                    pytest.skip("No completed data table artifact available")
-                raise
-
-    @pytest.mark.vcr
-    @pytest.mark.asyncio
-    @notebooklm_vcr.use_cassette("artifacts_download_quiz.yaml")
-    async def test_download_quiz(self, tmp_path):
-        """Download a quiz as JSON."""
-        async with vcr_client() as client:
-            output_path = tmp_path / "quiz.json"
-            try:
-                path = await client.artifacts.download_quiz(READONLY_NOTEBOOK_ID, str(output_path))
-                assert os.path.exists(path)
-                data = json.loads(output_path.read_text(encoding="utf-8"))
-                assert "title" in data
-                assert "questions" in data
-            except ValueError as e:
-                if "No completed quiz" in str(e):
-                    pytest.skip("No completed quiz artifact available")
-                raise
-
-    @pytest.mark.vcr
-    @pytest.mark.asyncio
-    @notebooklm_vcr.use_cassette("artifacts_download_quiz_markdown.yaml")
-    async def test_download_quiz_markdown(self, tmp_path):
-        """Download a quiz as markdown."""
-        async with vcr_client() as client:
-            output_path = tmp_path / "quiz.md"
-            try:
-                path = await client.artifacts.download_quiz(
-                    READONLY_NOTEBOOK_ID, str(output_path), output_format="markdown"
-                )
-                assert os.path.exists(path)
-                content = output_path.read_text(encoding="utf-8")
-                assert "# " in content  # Should have a heading
-                assert "Question" in content or "##" in content
-            except ValueError as e:
-                if "No completed quiz" in str(e):
-                    pytest.skip("No completed quiz artifact available")
-                raise
-
-    @pytest.mark.vcr
-    @pytest.mark.asyncio
-    @notebooklm_vcr.use_cassette("artifacts_download_flashcards.yaml")
-    async def test_download_flashcards(self, tmp_path):
-        """Download flashcards as JSON."""
-        async with vcr_client() as client:
-            output_path = tmp_path / "flashcards.json"
-            try:
-                path = await client.artifacts.download_flashcards(
-                    READONLY_NOTEBOOK_ID, str(output_path)
-                )
-                assert os.path.exists(path)
-                data = json.loads(output_path.read_text(encoding="utf-8"))
-                assert "title" in data
-                assert "cards" in data
-                # Verify normalized format (front/back, not f/b)
-                if data["cards"]:
-                    assert "front" in data["cards"][0]
-                    assert "back" in data["cards"][0]
-            except ValueError as e:
-                if "No completed flashcard" in str(e):
-                    pytest.skip("No completed flashcard artifact available")
-                raise
-
-    @pytest.mark.vcr
-    @pytest.mark.asyncio
-    @notebooklm_vcr.use_cassette("artifacts_download_flashcards_markdown.yaml")
-    async def test_download_flashcards_markdown(self, tmp_path):
-        """Download flashcards as markdown."""
-        async with vcr_client() as client:
-            output_path = tmp_path / "flashcards.md"
+    """Artifacts API download operations - parametrized to reduce duplication."""
+
+    @pytest.mark.vcr
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize(
+        ("method_name", "cassette", "filename", "kwargs", "missing_error", "check"),
+        ARTIFACT_DOWNLOAD_METHODS,
+        ids=[
+            "report",
+            "mind_map",
+            "data_table",
+            "quiz",
+            "quiz_markdown",
+            "flashcards",
+            "flashcards_markdown",
+        ],
+    )
+    async def test_download(
+        self, vcr_client, tmp_path, method_name, cassette, filename, kwargs, missing_error, check
+    ):
+        """Download an artifact and validate the written file."""
+        output_path = tmp_path / filename
+        with notebooklm_vcr.use_cassette(cassette):
+            method = getattr(vcr_client.artifacts, method_name)
             try:
-                path = await client.artifacts.download_flashcards(
-                    READONLY_NOTEBOOK_ID, str(output_path), output_format="markdown"
-                )
-                assert os.path.exists(path)
-                content = output_path.read_text(encoding="utf-8")
-                assert "# " in content  # Should have a heading
-                assert "**Q:**" in content or "Card" in content
+                path = await method(READONLY_NOTEBOOK_ID, str(output_path), **kwargs)
             except ValueError as e:
-                if "No completed flashcard" in str(e):
-                    pytest.skip("No completed flashcard artifact available")
+                if missing_error in str(e):
+                    pytest.skip(str(e))
                 raise
+        assert path == str(output_path)
+        check(output_path)
 
 
 # =============================================================================
@@ -474,6 +452,7 @@ class TestArtifactsDownloadAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestArtifactsGenerateAPI:
     """Artifacts API generation operations.
 
@@ -482,42 +461,38 @@ class TestArtifactsGenerateAPI:
     """
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("artifacts_generate_report.yaml")
-    async def test_generate_report(self):
+    async def test_generate_report(self, vcr_client):
         """Generate a briefing doc report."""
-        async with vcr_client() as client:
-            result = await client.artifacts.generate_report(
-                MUTABLE_NOTEBOOK_ID,
-                report_format=ReportFormat.BRIEFING_DOC,
-            )
+        result = await vcr_client.artifacts.generate_report(
+            MUTABLE_NOTEBOOK_ID,
+            report_format=ReportFormat.BRIEFING_DOC,
+        )
         assert result is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("artifacts_generate_study_guide.yaml")
-    async def test_generate_study_guide(self):
+    async def test_generate_study_guide(self, vcr_client):
         """Generate a study guide."""
-        async with vcr_client() as client:
-            result = await client.artifacts.generate_study_guide(MUTABLE_NOTEBOOK_ID)
+        result = await vcr_client.artifacts.generate_study_guide(MUTABLE_NOTEBOOK_ID)
         assert result is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("artifacts_generate_quiz.yaml")
-    async def test_generate_quiz(self):
+    async def test_generate_quiz(self, vcr_client):
         """Generate a quiz."""
-        async with vcr_client() as client:
-            result = await client.artifacts.generate_quiz(MUTABLE_NOTEBOOK_ID)
+        result = await vcr_client.artifacts.generate_quiz(MUTABLE_NOTEBOOK_ID)
         assert result is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("artifacts_generate_flashcards.yaml")
-    async def test_generate_flashcards(self):
+    async def test_generate_flashcards(self, vcr_client):
         """Generate flashcards."""
-        async with vcr_client() as client:
-            result = await client.artifacts.generate_flashcards(MUTABLE_NOTEBOOK_ID)
+        result = await vcr_client.artifacts.generate_flashcards(MUTABLE_NOTEBOOK_ID)
         assert result is not None
 
 
@@ -526,33 +501,32 @@ class TestArtifactsGenerateAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestChatAPI:
     """Chat API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("chat_ask.yaml")
-    async def test_ask(self):
+    async def test_ask(self, vcr_client):
         """Ask a question."""
-        async with vcr_client() as client:
-            result = await client.chat.ask(
-                MUTABLE_NOTEBOOK_ID,
-                "What is this notebook about?",
-            )
+        result = await vcr_client.chat.ask(
+            MUTABLE_NOTEBOOK_ID,
+            "What is this notebook about?",
+        )
         assert result is not None
         assert result.answer is not None
         assert result.conversation_id is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("chat_ask_with_references.yaml")
-    async def test_ask_with_references(self):
+    async def test_ask_with_references(self, vcr_client):
         """Ask a question that generates references."""
-        async with vcr_client() as client:
-            result = await client.chat.ask(
-                MUTABLE_NOTEBOOK_ID,
-                "Summarize the key points with specific citations from the sources.",
-            )
+        result = await vcr_client.chat.ask(
+            MUTABLE_NOTEBOOK_ID,
+            "Summarize the key points with specific citations from the sources.",
+        )
         assert result is not None
         assert result.answer is not None
         # References may or may not be present depending on the answer
@@ -563,12 +537,11 @@ class TestChatAPI:
             assert ref.citation_number is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("chat_get_history.yaml")
-    async def test_get_history(self):
+    async def test_get_history(self, vcr_client):
         """Get chat history."""
-        async with vcr_client() as client:
-            history = await client.chat.get_history(MUTABLE_NOTEBOOK_ID)
+        history = await vcr_client.chat.get_history(MUTABLE_NOTEBOOK_ID)
         assert isinstance(history, list)
 
 
@@ -577,33 +550,32 @@ class TestChatAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestSettingsAPI:
     """Settings API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("settings_get_output_language.yaml")
-    async def test_get_output_language(self):
+    async def test_get_output_language(self, vcr_client):
         """Get current output language setting."""
-        async with vcr_client() as client:
-            language = await client.settings.get_output_language()
+        language = await vcr_client.settings.get_output_language()
         # Language may be None if not set, or a string like "en", "ja", "zh_Hans"
         assert language is None or isinstance(language, str)
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("settings_set_output_language.yaml")
-    async def test_set_output_language(self):
+    async def test_set_output_language(self, vcr_client):
         """Set output language (then restore original)."""
-        async with vcr_client() as client:
-            # Get current language to restore later
-            original = await client.settings.get_output_language()
-            # Set to English
-            result = await client.settings.set_output_language("en")
-            assert result == "en" or result is None
-            # Restore original if it was set
-            if original:
-                await client.settings.set_output_language(original)
+        # Get current language to restore later
+        original = await vcr_client.settings.get_output_language()
+        # Set to English
+        result = await vcr_client.settings.set_output_language("en")
+        assert result == "en" or result is None
+        # Restore original if it was set
+        if original:
+            await vcr_client.settings.set_output_language(original)
 
 
 # =============================================================================
@@ -611,34 +583,33 @@ class TestSettingsAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestSharingAPI:
     """Sharing API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sharing_get_status.yaml")
-    async def test_get_status(self):
+    async def test_get_status(self, vcr_client):
         """Get sharing status for a notebook."""
-        async with vcr_client() as client:
-            status = await client.sharing.get_status(READONLY_NOTEBOOK_ID)
+        status = await vcr_client.sharing.get_status(READONLY_NOTEBOOK_ID)
         assert status is not None
         assert status.notebook_id == READONLY_NOTEBOOK_ID
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sharing_set_public.yaml")
-    async def test_set_public(self):
+    async def test_set_public(self, vcr_client):
         """Toggle public sharing (restore original state)."""
-        async with vcr_client() as client:
-            # Get current status
-            original = await client.sharing.get_status(MUTABLE_NOTEBOOK_ID)
-            # Toggle to opposite
-            new_status = await client.sharing.set_public(
-                MUTABLE_NOTEBOOK_ID, not original.is_public
-            )
-            assert new_status.is_public != original.is_public
-            # Restore original state
-            await client.sharing.set_public(MUTABLE_NOTEBOOK_ID, original.is_public)
+        # Get current status
+        original = await vcr_client.sharing.get_status(MUTABLE_NOTEBOOK_ID)
+        # Toggle to opposite
+        new_status = await vcr_client.sharing.set_public(
+            MUTABLE_NOTEBOOK_ID, not original.is_public
+        )
+        assert new_status.is_public != original.is_public
+        # Restore original state
+        await vcr_client.sharing.set_public(MUTABLE_NOTEBOOK_ID, original.is_public)
 
 
 # =============================================================================
@@ -646,113 +617,100 @@ class TestSharingAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestSourcesAdditionalAPI:
     """Additional sources API operations not covered in main TestSourcesAPI."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_add_file.yaml")
-    async def test_add_file(self, tmp_path):
+    async def test_add_file(self, vcr_client, vcr_test_file):
         """Add a file source."""
-        # Create a test file
-        test_file = tmp_path / "vcr_test_document.txt"
-        test_file.write_text("This is a test document for VCR cassette recording.")
-
-        async with vcr_client() as client:
-            source = await client.sources.add_file(
-                MUTABLE_NOTEBOOK_ID,
-                str(test_file),
-            )
+        source = await vcr_client.sources.add_file(
+            MUTABLE_NOTEBOOK_ID,
+            str(vcr_test_file),
+        )
         assert source is not None
         assert source.id is not None
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_check_freshness.yaml")
-    async def test_check_freshness(self):
+    async def test_check_freshness(self, vcr_client):
         """Check source freshness."""
-        async with vcr_client() as client:
-            sources = await client.sources.list(READONLY_NOTEBOOK_ID)
-            if not sources:
-                pytest.skip("No sources available")
-            is_fresh = await client.sources.check_freshness(READONLY_NOTEBOOK_ID, sources[0].id)
+        sources = await vcr_client.sources.list(READONLY_NOTEBOOK_ID)
+        if not sources:
+            pytest.skip("No sources available")
+        is_fresh = await vcr_client.sources.check_freshness(READONLY_NOTEBOOK_ID, sources[0].id)
         assert isinstance(is_fresh, bool)
         # The cassette shows API returns [] which should be interpreted as fresh
         assert is_fresh is True, "Source in cassette should be fresh (API returned [])"
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_check_freshness_drive.yaml")
-    async def test_check_freshness_drive(self):
+    async def test_check_freshness_drive(self, vcr_client):
         """Check freshness for Drive source (different response format)."""
-        from notebooklm import SourceType
-
-        async with vcr_client() as client:
-            sources = await client.sources.list(MUTABLE_NOTEBOOK_ID)
-            if not sources:
-                pytest.skip("No sources available")
-            # Find a GOOGLE_DOCS source
-            drive_source = next((s for s in sources if s.kind == SourceType.GOOGLE_DOCS), None)
-            if not drive_source:
-                pytest.skip("No GOOGLE_DOCS source available")
-            is_fresh = await client.sources.check_freshness(MUTABLE_NOTEBOOK_ID, drive_source.id)
+        sources = await vcr_client.sources.list(MUTABLE_NOTEBOOK_ID)
+        if not sources:
+            pytest.skip("No sources available")
+        # Find a GOOGLE_DOCS source
+        drive_source = next((s for s in sources if s.kind == SourceType.GOOGLE_DOCS), None)
+        if not drive_source:
+            pytest.skip("No GOOGLE_DOCS source available")
+        is_fresh = await vcr_client.sources.check_freshness(MUTABLE_NOTEBOOK_ID, drive_source.id)
         assert isinstance(is_fresh, bool)
         # Drive sources return [[null, true, [source_id]]] when fresh
         assert is_fresh is True, "Drive source should be fresh"
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_refresh.yaml")
-    async def test_refresh(self):
+    async def test_refresh(self, vcr_client):
         """Refresh a source."""
-        from notebooklm import SourceType
-
-        async with vcr_client() as client:
-            sources = await client.sources.list(MUTABLE_NOTEBOOK_ID)
-            if not sources:
-                pytest.skip("No sources available")
-            # Find a WEB_PAGE source (text sources can't be refreshed)
-            url_source = next((s for s in sources if s.kind == SourceType.WEB_PAGE), None)
-            if not url_source:
-                pytest.skip("No WEB_PAGE source available for refresh")
-            result = await client.sources.refresh(MUTABLE_NOTEBOOK_ID, url_source.id)
+        sources = await vcr_client.sources.list(MUTABLE_NOTEBOOK_ID)
+        if not sources:
+            pytest.skip("No sources available")
+        # Find a WEB_PAGE source (text sources can't be refreshed)
+        url_source = next((s for s in sources if s.kind == SourceType.WEB_PAGE), None)
+        if not url_source:
+            pytest.skip("No WEB_PAGE source available for refresh")
+        result = await vcr_client.sources.refresh(MUTABLE_NOTEBOOK_ID, url_source.id)
         # refresh() returns True if initiated successfully (no exception)
         assert result is True, "refresh() should return True on success"
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_rename.yaml")
-    async def test_rename(self):
+    async def test_rename(self, vcr_client):
         """Rename a source (then restore original name)."""
-        async with vcr_client() as client:
-            sources = await client.sources.list(MUTABLE_NOTEBOOK_ID)
-            if not sources:
-                pytest.skip("No sources available")
-            source = sources[0]
-            original_title = source.title
-            # Rename
-            renamed = await client.sources.rename(
-                MUTABLE_NOTEBOOK_ID, source.id, "VCR Test Renamed Source"
-            )
-            assert renamed.title == "VCR Test Renamed Source"
-            # Restore
-            await client.sources.rename(MUTABLE_NOTEBOOK_ID, source.id, original_title)
-
-    @pytest.mark.vcr
-    @pytest.mark.asyncio
+        sources = await vcr_client.sources.list(MUTABLE_NOTEBOOK_ID)
+        if not sources:
+            pytest.skip("No sources available")
+        source = sources[0]
+        original_title = source.title
+        # Rename
+        renamed = await vcr_client.sources.rename(
+            MUTABLE_NOTEBOOK_ID, source.id, "VCR Test Renamed Source"
+        )
+        assert renamed.title == "VCR Test Renamed Source"
+        # Restore
+        await vcr_client.sources.rename(MUTABLE_NOTEBOOK_ID, source.id, original_title)
+
+    @pytest.mark.vcr
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("sources_delete.yaml")
-    async def test_delete(self):
+    async def test_delete(self, vcr_client):
         """Delete a source (creates one first to delete)."""
-        async with vcr_client() as client:
-            # Create a source to delete
-            source = await client.sources.add_text(
-                MUTABLE_NOTEBOOK_ID,
-                title="VCR Delete Test Source",
-                content="This source will be deleted.",
-            )
-            assert source is not None
-            # Delete it
-            result = await client.sources.delete(MUTABLE_NOTEBOOK_ID, source.id)
+        # Create a source to delete
+        source = await vcr_client.sources.add_text(
+            MUTABLE_NOTEBOOK_ID,
+            title="VCR Delete Test Source",
+            content="This source will be deleted.",
+        )
+        assert source is not None
+        # Delete it
+        result = await vcr_client.sources.delete(MUTABLE_NOTEBOOK_ID, source.id)
         assert result is True
 
 
@@ -761,42 +719,40 @@ class TestSourcesAdditionalAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestNotebooksAdditionalAPI:
     """Additional notebooks API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notebooks_create.yaml")
-    async def test_create(self):
+    async def test_create(self, vcr_client):
         """Create a new notebook."""
-        async with vcr_client() as client:
-            notebook = await client.notebooks.create("VCR Test Notebook")
+        notebook = await vcr_client.notebooks.create("VCR Test Notebook")
         assert notebook is not None
         assert notebook.title == "VCR Test Notebook"
         # Note: We don't delete it here to keep the cassette simple
         # A separate delete test will clean up
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notebooks_delete.yaml")
-    async def test_delete(self):
+    async def test_delete(self, vcr_client):
         """Delete a notebook (creates one first)."""
-        async with vcr_client() as client:
-            # Create a notebook to delete
-            notebook = await client.notebooks.create("VCR Delete Test Notebook")
-            assert notebook is not None
-            # Delete it
-            result = await client.notebooks.delete(notebook.id)
+        # Create a notebook to delete
+        notebook = await vcr_client.notebooks.create("VCR Delete Test Notebook")
+        assert notebook is not None
+        # Delete it
+        result = await vcr_client.notebooks.delete(notebook.id)
         assert result is True
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notebooks_remove_from_recent.yaml")
-    async def test_remove_from_recent(self):
+    async def test_remove_from_recent(self, vcr_client):
         """Remove a notebook from recently viewed."""
-        async with vcr_client() as client:
-            # This just removes from the recent list, doesn't delete
-            await client.notebooks.remove_from_recent(MUTABLE_NOTEBOOK_ID)
+        # This just removes from the recent list, doesn't delete
+        await vcr_client.notebooks.remove_from_recent(MUTABLE_NOTEBOOK_ID)
         # No return value to check - if it doesn't raise, it worked
 
 
@@ -805,24 +761,24 @@ class TestNotebooksAdditionalAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestNotesAdditionalAPI:
     """Additional notes API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("notes_delete.yaml")
-    async def test_delete(self):
+    async def test_delete(self, vcr_client):
         """Delete a note (creates one first)."""
-        async with vcr_client() as client:
-            # Create a note to delete
-            note = await client.notes.create(
-                MUTABLE_NOTEBOOK_ID,
-                title="VCR Delete Test Note",
-                content="This note will be deleted.",
-            )
-            assert note is not None
-            # Delete it
-            result = await client.notes.delete(MUTABLE_NOTEBOOK_ID, note.id)
+        # Create a note to delete
+        note = await vcr_client.notes.create(
+            MUTABLE_NOTEBOOK_ID,
+            title="VCR Delete Test Note",
+            content="This note will be deleted.",
+        )
+        assert note is not None
+        # Delete it
+        result = await vcr_client.notes.delete(MUTABLE_NOTEBOOK_ID, note.id)
         assert result is True
 
 
@@ -831,57 +787,54 @@ class TestNotesAdditionalAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestArtifactsAdditionalAPI:
     """Additional artifacts API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("artifacts_rename.yaml")
-    async def test_rename(self):
+    async def test_rename(self, vcr_client):
         """Rename an artifact."""
-        async with vcr_client() as client:
-            # List artifacts to find one to rename
-            artifacts = await client.artifacts.list(MUTABLE_NOTEBOOK_ID)
-            if not artifacts:
-                pytest.skip("No artifacts available")
-            artifact = artifacts[0]
-            original_title = artifact.title
-            # Rename
-            await client.artifacts.rename(MUTABLE_NOTEBOOK_ID, artifact.id, "VCR Renamed Artifact")
-            # Restore original name
-            await client.artifacts.rename(MUTABLE_NOTEBOOK_ID, artifact.id, original_title)
-
-    @pytest.mark.vcr
-    @pytest.mark.asyncio
+        # List artifacts to find one to rename
+        artifacts = await vcr_client.artifacts.list(MUTABLE_NOTEBOOK_ID)
+        if not artifacts:
+            pytest.skip("No artifacts available")
+        artifact = artifacts[0]
+        original_title = artifact.title
+        # Rename
+        await vcr_client.artifacts.rename(MUTABLE_NOTEBOOK_ID, artifact.id, "VCR Renamed Artifact")
+        # Restore original name
+        await vcr_client.artifacts.rename(MUTABLE_NOTEBOOK_ID, artifact.id, original_title)
+
+    @pytest.mark.vcr
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("artifacts_delete.yaml")
-    async def test_delete(self):
+    async def test_delete(self, vcr_client):
         """Delete an artifact."""
-        async with vcr_client() as client:
-            # List existing artifacts
-            artifacts = await client.artifacts.list(MUTABLE_NOTEBOOK_ID)
-            if not artifacts:
-                pytest.skip("No artifacts available to delete")
-            # Delete the first one
-            artifact_id = artifacts[0].id
-            deleted = await client.artifacts.delete(MUTABLE_NOTEBOOK_ID, artifact_id)
+        # List existing artifacts
+        artifacts = await vcr_client.artifacts.list(MUTABLE_NOTEBOOK_ID)
+        if not artifacts:
+            pytest.skip("No artifacts available to delete")
+        # Delete the first one
+        artifact_id = artifacts[0].id
+        deleted = await vcr_client.artifacts.delete(MUTABLE_NOTEBOOK_ID, artifact_id)
         assert deleted is True
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("artifacts_export_report.yaml")
-    async def test_export_report(self):
+    async def test_export_report(self, vcr_client):
         """Export a report to Google Docs."""
-        async with vcr_client() as client:
-            # Find a completed report artifact
-            reports = await client.artifacts.list_reports(MUTABLE_NOTEBOOK_ID)
-            completed_reports = [r for r in reports if r.is_completed]
-            if not completed_reports:
-                pytest.skip("No completed report artifact available")
-            report = completed_reports[0]
-            # Export it to Google Docs
-            result = await client.artifacts.export_report(
-                MUTABLE_NOTEBOOK_ID, report.id, title="VCR Export Test"
-            )
+        # Find a completed report artifact
+        reports = await vcr_client.artifacts.list_reports(MUTABLE_NOTEBOOK_ID)
+        report = next((r for r in reports if r.is_completed), None)
+        if report is None:
+            pytest.skip("No completed report artifact available")
+        # Export it to Google Docs
+        result = await vcr_client.artifacts.export_report(
+            MUTABLE_NOTEBOOK_ID, report.id, title="VCR Export Test"
+        )
         assert result is not None
 
 
@@ -890,84 +843,81 @@ class TestArtifactsAdditionalAPI:
 # =============================================================================
 
 
+@mutable_group
 class TestResearchAPI:
     """Research API operations."""
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("research_start_fast.yaml")
-    async def test_start_fast(self):
+    async def test_start_fast(self, vcr_client):
         """Start fast web research."""
-        async with vcr_client() as client:
-            result = await client.research.start(
-                MUTABLE_NOTEBOOK_ID,
-                query="Python programming best practices",
-                source="web",
-                mode="fast",
-            )
+        result = await vcr_client.research.start(
+            MUTABLE_NOTEBOOK_ID,
+            query="Python programming best practices",
+            source="web",
+            mode="fast",
+        )
         assert result is not None
         assert "task_id" in result
         assert result["mode"] == "fast"
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("research_poll.yaml")
-    async def test_poll(self):
+    async def test_poll(self, vcr_client):
         """Poll research status."""
-        async with vcr_client() as client:
-            # Start research first
-            await client.research.start(
-                MUTABLE_NOTEBOOK_ID,
-                query="Machine learning fundamentals",
-                source="web",
-                mode="fast",
-            )
-            # Poll for results
-            result = await client.research.poll(MUTABLE_NOTEBOOK_ID)
+        # Start research first
+        await vcr_client.research.start(
+            MUTABLE_NOTEBOOK_ID,
+            query="Machine learning fundamentals",
+            source="web",
+            mode="fast",
+        )
+        # Poll for results
+        result = await vcr_client.research.poll(MUTABLE_NOTEBOOK_ID)
         assert result is not None
         assert "status" in result
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("research_import_sources.yaml")
-    async def test_import_sources(self):
+    async def test_import_sources(self, vcr_client):
         """Import research sources."""
-        async with vcr_client() as client:
-            # Start research
-            start_result = await client.research.start(
-                MUTABLE_NOTEBOOK_ID,
-                query="Data science tutorials",
-                source="web",
-                mode="fast",
-            )
-            if not start_result:
-                pytest.skip("Could not start research")
-
-            # Poll until we have sources (with timeout via cassette)
-            poll_result = await client.research.poll(MUTABLE_NOTEBOOK_ID)
-            if not poll_result.get("sources"):
-                pytest.skip("No research sources found")
-
-            # Import first source
-            imported = await client.research.import_sources(
-                MUTABLE_NOTEBOOK_ID,
-                start_result["task_id"],
-                poll_result["sources"][:1],
-            )
+        # Start research
+        start_result = await vcr_client.research.start(
+            MUTABLE_NOTEBOOK_ID,
+            query="Data science tutorials",
+            source="web",
+            mode="fast",
+        )
+        if not start_result:
+            pytest.skip("Could not start research")
+
+        # Poll until we have sources (with timeout via cassette)
+        poll_result = await vcr_client.research.poll(MUTABLE_NOTEBOOK_ID)
+        if not poll_result.get("sources"):
+            pytest.skip("No research sources found")
+
+        # Import first source
+        imported = await vcr_client.research.import_sources(
+            MUTABLE_NOTEBOOK_ID,
+            start_result["task_id"],
+            poll_result["sources"][:1],
+        )
         assert isinstance(imported, list)
 
     @pytest.mark.vcr
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     @notebooklm_vcr.use_cassette("research_start_deep.yaml")
-    async def test_start_deep(self):
+    async def test_start_deep(self, vcr_client):
         """Start deep web research."""
-        async with vcr_client() as client:
-            result = await client.research.start(
-                MUTABLE_NOTEBOOK_ID,
-                query="Artificial intelligence history",
-                source="web",
-                mode="deep",
-            )
+        result = await vcr_client.research.start(
+            MUTABLE_NOTEBOOK_ID,
+            query="Artificial intelligence history",
+            source="web",
+            mode="deep",
+        )
         assert result is not None
         assert "task_id" in result
         assert result["mode"] == "deep"
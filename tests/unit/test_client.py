@@ -8,7 +8,7 @@ import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from notebooklm._core import ClientCore, is_auth_error
+from notebooklm._core import DEFAULT_LIMITS, ClientCore, is_auth_error
 from notebooklm.auth import AuthTokens
 from notebooklm.client import NotebookLMClient
 from notebooklm.rpc import AuthError, RPCError, RPCMethod
@@ -47,6 +47,26 @@ class TestNotebookLMClientInit:
         client = NotebookLMClient(mock_auth)
         assert client.is_connected is False
 
+    @pytest.mark.asyncio
+    async def test_client_uses_default_connection_limits(self, mock_auth):
+        """Test the HTTP client is created with DEFAULT_LIMITS by default."""
+        with patch("notebooklm._core.httpx.AsyncClient", wraps=httpx.AsyncClient) as mock_cls:
+            async with NotebookLMClient(mock_auth):
+                pass
+
+        assert mock_cls.call_args.kwargs["limits"] is DEFAULT_LIMITS
+
+    @pytest.mark.asyncio
+    async def test_client_passes_custom_connection_limits(self, mock_auth):
+        """Test custom httpx.Limits are forwarded to the HTTP client."""
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+
+        with patch("notebooklm._core.httpx.AsyncClient", wraps=httpx.AsyncClient) as mock_cls:
+            async with NotebookLMClient(mock_auth, limits=limits):
+                pass
+
+        assert mock_cls.call_args.kwargs["limits"] is limits
+
 
 # =============================================================================
 # CONTEXT MANAGER TESTS
@@ -1,6 +1,7 @@
 """Tests for conversation functionality."""
 
 import json
+import re
 
 import pytest
 
@@ -17,30 +18,20 @@ def auth_tokens():
     )
 
 
+def _make_answer_body(text: str) -> bytes:
+    """Build a streamed chat response body containing a single answer."""
+    inner_json = json.dumps([[text, None, None, None, [1]]])
+    chunk_json = json.dumps([["wrb.fr", None, inner_json]])
+    return f")]}}'\n{len(chunk_json)}\n{chunk_json}\n".encode()
+
+
 class TestAsk:
     @pytest.mark.asyncio
     async def test_ask_new_conversation(self, auth_tokens, httpx_mock):
-        import re
-
         # Mock ask response (streaming chunks)
-        inner_json = json.dumps(
-            [
-                [
-                    "This is the answer. It is now long enough to be valid.",
-                    None,
-                    None,
-                    None,
-                    [1],
-                ]
-            ]
-        )
-        chunk_json = json.dumps([["wrb.fr", None, inner_json]])
-
-        response_body = f")]}}'\n{len(chunk_json)}\n{chunk_json}\n"
-
         httpx_mock.add_response(
             url=re.compile(r".*GenerateFreeFormStreamed.*"),
-            content=response_body.encode(),
+            content=_make_answer_body("This is the answer. It is now long enough to be valid."),
             method="POST",
         )
 
@@ -58,21 +49,12 @@ class TestAsk:
 
     @pytest.mark.asyncio
     async def test_ask_follow_up(self, auth_tokens, httpx_mock):
-        inner_json = json.dumps(
-            [
-                [
-                    "Follow-up answer. This also needs to be longer than twenty characters.",
-                    None,
-                    None,
-                    None,
-                    [1],
-                ]
-            ]
+        httpx_mock.add_response(
+            content=_make_answer_body(
+                "Follow-up answer. This also needs to be longer than twenty characters."
+            ),
+            method="POST",
         )
-        chunk_json = json.dumps([["wrb.fr", None, inner_json]])
-        response_body = f")]}}'\n{len(chunk_json)}\n{chunk_json}\n"
-
-        httpx_mock.add_response(content=response_body.encode(), method="POST")
 
         async with NotebookLMClient(auth_tokens) as client:
             # Seed cache via core client
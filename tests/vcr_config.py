@@ -35,6 +35,7 @@ import re
 from typing import Any
 
 import vcr
+from vcr.persisters.filesystem import FilesystemPersister
 
 # =============================================================================
 # Sensitive data patterns to scrub from cassettes
@@ -94,6 +95,28 @@ SENSITIVE_PATTERNS: list[tuple[str, str]] = [
 ]
 
 
+# Response headers the client never reads; dropped at record time to keep
+# cassettes small (CSP alone is several hundred bytes per interaction)
+NOISY_RESPONSE_HEADERS: frozenset[str] = frozenset(
+    {
+        "accept-ch",
+        "alt-svc",
+        "content-security-policy",
+        "cross-origin-opener-policy",
+        "cross-origin-resource-policy",
+        "nel",
+        "p3p",
+        "permissions-policy",
+        "report-to",
+        "reporting-endpoints",
+        "server-timing",
+        "strict-transport-security",
+        "x-frame-options",
+        "x-xss-protection",
+    }
+)
+
+
 def scrub_string(text: str) -> str:
     """Apply all sensitive pattern replacements to a string."""
     for pattern, replacement in SENSITIVE_PATTERNS:
@@ -138,6 +161,8 @@ def scrub_response(response: dict[str, Any]) -> dict[str, Any]:
     - Response body (may contain tokens in JSON or echoed headers)
     - Response headers (Set-Cookie headers may contain session tokens)
     - Both string and bytes response bodies
+
+    Also drops NOISY_RESPONSE_HEADERS.
     """
     # Scrub response body
     body = response.get("body", {})
@@ -152,8 +177,11 @@ def scrub_response(response: dict[str, Any]) -> dict[str, Any]:
         else:
             body["string"] = scrub_string(content)
 
-    # Scrub Set-Cookie headers (may contain session tokens)
     headers = response.get("headers", {})
+    for name in [h for h in headers if h.lower() in NOISY_RESPONSE_HEADERS]:
+        del headers[name]
+
+    # Scrub Set-Cookie headers (may contain session tokens)
     if "Set-Cookie" in headers:
         cookies = headers["Set-Cookie"]
         if isinstance(cookies, list):
@@ -164,6 +192,23 @@ def scrub_response(response: dict[str, Any]) -> dict[str, Any]:
     return response
 
 
+class CachingPersister(FilesystemPersister):
+    """Filesystem persister that parses each cassette only once per session.
+
+    Only registered in replay mode, where cassettes are never written, so the
+    cached interactions can't go stale.
+    """
+
+    _cache: dict[str, tuple[list[Any], list[Any]]] = {}
+
+    @classmethod
+    def load_cassette(cls, cassette_path, serializer):
+        key = str(cassette_path)
+        if key not in cls._cache:
+            cls._cache[key] = super().load_cassette(cassette_path, serializer)
+        return cls._cache[key]
+
+
 # =============================================================================
 # VCR Configuration
 # =============================================================================
@@ -193,3 +238,7 @@ notebooklm_vcr = vcr.VCR(
     # Decode compressed responses for easier inspection
     decode_compressed_response=True,
 )
+
+# Replay re-reads the same cassettes many times; keep them parsed in memory
+if _record_mode == "none":
+    notebooklm_vcr.register_persister(CachingPersister)